@@ -1,10 +1,11 @@
-from collections.abc import Sequence
+from collections.abc import Collection, Sequence
+from concurrent.futures import Future
 from typing import Any
 
 from shared_kernel.detection_core.domain.detection import Detection
 from shared_kernel.detection_core.ports.detector_port import DetectorPort
-from shared_kernel.result_monad import Result
 from shared_kernel.exceptions import DomainError
+from shared_kernel.result_monad import Result
 from shared_kernel.semantic_model.labels import SemanticClass
 
 
@@ -20,7 +21,7 @@ class DetectionService:
     def detect_objects(
         self,
         frame: Any,
-        filter_classes: Sequence[SemanticClass] | None = None
+        filter_classes: Collection[SemanticClass] | None = None
     ) -> Result[Sequence[Detection], DomainError]:
         """
         Executes detection logic on a single frame.
@@ -33,4 +34,45 @@ class DetectionService:
             Result monad containing sequence of Detections or error string.
         """
         # logic buisness here in the future
-        return self._detector.detect(frame, filter_classes)
\ No newline at end of file
+        return self._detector.detect(frame, self._as_filter(filter_classes))
+
+    def detect_objects_batch(
+        self,
+        frames: Sequence[Any],
+        filter_classes: Collection[SemanticClass] | None = None
+    ) -> Result[Sequence[Sequence[Detection]], DomainError]:
+        """
+        Executes detection logic on a batch of frames.
+
+        Args:
+            frames: Input image frames of the same shape.
+            filter_classes: Optional list of SemanticClasses to filter results.
+
+        Returns:
+            Result monad containing sequence of Detections per frame or error.
+        """
+        return self._detector.detect_batch(frames, self._as_filter(filter_classes))
+
+    def submit_objects_batch(
+        self,
+        frames: Sequence[Any],
+        filter_classes: Collection[SemanticClass] | None = None
+    ) -> Future[Result[Sequence[Sequence[Detection]], DomainError]]:
+        """
+        Starts detection on a batch of frames without blocking.
+
+        Args:
+            frames: Input image frames of the same shape.
+            filter_classes: Optional list of SemanticClasses to filter results.
+
+        Returns:
+            Future of the Result returned by `detect_objects_batch`.
+        """
+        return self._detector.submit_batch(frames, self._as_filter(filter_classes))
+
+    @staticmethod
+    def _as_filter(
+        filter_classes: Collection[SemanticClass] | None
+    ) -> frozenset[SemanticClass] | None:
+        """Freeze filter once so adapters get O(1) membership checks."""
+        return frozenset(filter_classes) if filter_classes else None
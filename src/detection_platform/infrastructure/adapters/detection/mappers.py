@@ -15,4 +15,13 @@ class YoloClassMapper:
 
     @classmethod
     def map_id(cls, class_id: int) -> SemanticClass:
-        return cls._MAPPING.get(class_id, SemanticClass.UNKNOWN)
+        if 0 <= class_id < len(_ID_TO_CLASS):
+            return _ID_TO_CLASS[class_id]
+        return SemanticClass.UNKNOWN
+
+
+# Dense lookup (index = YOLO class ID), avoids hashing on every call
+_ID_TO_CLASS: tuple[SemanticClass, ...] = tuple(
+    YoloClassMapper._MAPPING.get(class_id, SemanticClass.UNKNOWN)
+    for class_id in range(max(YoloClassMapper._MAPPING) + 1)
+)
@@ -1,31 +1,199 @@
-from collections.abc import Iterable, Sequence
+from collections.abc import Collection, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
 from typing import Any, cast
 
-from ultralytics import YOLO  # type: ignore[attr-defined]
+import cv2
 import numpy as np
+import torch
+from ultralytics import YOLO  # type: ignore[attr-defined]
+from ultralytics.utils.ops import scale_boxes
+
+try:
+    from ultralytics.utils.nms import non_max_suppression
+except ImportError:  # Ultralytics < 8.3.200 keeps NMS in ops
+    from ultralytics.utils.ops import (  # type: ignore[no-redef, unused-ignore]
+        non_max_suppression,
+    )
 
 from shared_kernel.detection_core.domain.detection import Detection
+from shared_kernel.detection_core.domain.detection_batch import (
+    CLASS_CODES,
+    DetectionBatch,
+)
 from shared_kernel.detection_core.ports.detector_port import DetectorPort
+from shared_kernel.exceptions import InfrastructureError
 from shared_kernel.result_monad import Err, Ok, Result
 from shared_kernel.semantic_model.labels import SemanticClass
-from shared_kernel.value_objects import BoundingBox
-from shared_kernel.exceptions import InfrastructureError
 
 from .mappers import YoloClassMapper
 
+# Default model input size (longer side) used for export and inference
+IMGSZ = 640
+# IoU threshold of NMS in direct inference, Ultralytics predict default
+NMS_IOU = 0.7
+# Letterbox padding value of direct inference, Ultralytics default
+LETTERBOX_PAD = 114
+
 
 class YoloAdapter(DetectorPort):
-    def __init__(self, model_path: str, confidence_threshold: float = 0.5) -> None:
+    def __init__(
+        self,
+        model_path: str,
+        confidence_threshold: float = 0.5,
+        *,
+        half: bool = False,
+        accelerate: bool = False,
+        max_batch_size: int = 1,
+        imgsz: int = IMGSZ
+    ) -> None:
+        """
+        Args:
+            model_path: Path to YOLO weights (.pt) or exported model (.engine, .onnx).
+            confidence_threshold: Minimum confidence of returned detections.
+            half: Run inference in FP16 (CUDA only).
+            accelerate: Export .pt weights once to TensorRT (CUDA) or ONNX (CPU)
+                and load the exported model instead.
+            max_batch_size: Largest batch passed to detect_batch, sizes the
+                dynamic batch profile of the exported model.
+            imgsz: Model input size (longer side), smaller runs faster at the
+                cost of small objects.
+        """
         try:
+            self._half = half and torch.cuda.is_available()
+            self._imgsz = imgsz
+            if accelerate:
+                model_path = self._export_accelerated(
+                    model_path, self._half, max_batch_size, imgsz
+                )
             self._model = YOLO(model_path)
             self._conf_threshold = confidence_threshold
+            self._predict_args: dict[str, Any] = {
+                "conf": confidence_threshold, "imgsz": imgsz, "verbose": False
+            }
+            if self._half:
+                self._predict_args["half"] = True
+            # YOLO class ID -> DetectionBatch class code, one lookup for all boxes
+            self._id_to_code = np.array(
+                [
+                    CLASS_CODES[YoloClassMapper.map_id(class_id)]
+                    for class_id in range(len(self._model.names))
+                ],
+                dtype=np.int8
+            )
+            # Plain PyTorch detect weights are called directly with reused input
+            # buffers. Exported models (.engine, .onnx) and other heads (segment,
+            # pose, OBB, NMS-free end-to-end) go through Ultralytics predict
+            self._device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+            # Single worker runs every inference: Ultralytics predictors and the
+            # reused input buffers are not thread-safe. One request runs on the
+            # device while the caller post-processes the last
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="yolo-inference"
+            )
+            self._host_buf: torch.Tensor | None = None
+            self._device_buf: torch.Tensor | None = None
+            self._net: torch.nn.Module | None = None
+            self._max_batch_size = max_batch_size
+            # Set once the compiled module is warmed up on a fixed input shape
+            self._static_input = False
+            if self._supports_direct(model_path):
+                detection_model: Any = self._model.model
+                self._stride = int(detection_model.stride.max())
+                # Round up to the stride, as Ultralytics check_imgsz does
+                self._imgsz = -(-imgsz // self._stride) * self._stride
+                net = detection_model.fuse(verbose=False).to(self._device).eval()
+                net = net.half() if self._half else net
+                if self._device.type == "cuda":
+                    net = self._compile(net)
+                self._net = net
+            self._resize_buf = np.empty((0, 0, 3), dtype=np.uint8)
         except Exception as e:
             raise RuntimeError(f"Failed to load YOLO model: {e}") from e
 
+    def close(self) -> None:
+        """Wait for in-flight inference and release the worker thread."""
+        self._executor.shutdown(wait=True)
+
+    def _supports_direct(self, model_path: str) -> bool:
+        """Direct inference handles PyTorch weights with a plain detect head only."""
+        return (
+            Path(model_path).suffix == ".pt"
+            and self._model.task == "detect"
+            and not getattr(self._model.model, "end2end", False)
+        )
+
+    def _compile(self, net: torch.nn.Module) -> torch.nn.Module:
+        """
+        Compile the module with torch.compile (operator fusion, CUDA graphs)
+        and trigger compilation with a warmup pass, so the first frame does not
+        pay for it. The warmup uses the full (max_batch_size, 3, imgsz, imgsz)
+        input, which direct inference then keeps for every call, so no batch
+        recompiles or re-captures the graph. The warmup runs on the worker
+        thread, CUDA graphs are recorded per thread. Returns the eager module
+        if compilation is unavailable or fails.
+        """
+        if not hasattr(torch, "compile"):  # PyTorch < 2.0
+            return net
+
+        compiled = torch.compile(net, mode="reduce-overhead")
+        try:
+            self._executor.submit(self._warmup, compiled).result()
+        except Exception:
+            return net
+        self._static_input = True
+        return compiled  # type: ignore[return-value]
+
+    def _warmup(self, net: Any) -> None:
+        """Run net once on a zeroed input of the full batch shape."""
+        square = (self._imgsz, self._imgsz)
+        _, device_buf = self._input_buffers(self._max_batch_size, square)
+        with torch.inference_mode():
+            images = device_buf.half() if self._half else device_buf.float()
+            net(images.zero_())
+
+    @staticmethod
+    def _export_accelerated(
+        model_path: str,
+        half: bool,
+        max_batch_size: int,
+        imgsz: int
+    ) -> str:
+        """
+        Export PyTorch weights to an accelerated format, cached next to the .pt.
+        TensorRT engine on CUDA (FP16 tensor cores with `half`), ONNX Runtime otherwise.
+        Input size, precision and max batch size are part of the cached file
+        name, so an export made with other settings is never reused.
+
+        Returns:
+            Path of the model to load. Non .pt paths are returned unchanged.
+        """
+        weights = Path(model_path)
+        if weights.suffix != ".pt":
+            return model_path
+
+        export_args: dict[str, Any] = {"dynamic": True, "batch": max_batch_size}
+        if torch.cuda.is_available():
+            suffix = ".engine"
+            export_args.update(format="engine", half=half, workspace=4)
+        else:
+            suffix = ".onnx"
+            export_args.update(format="onnx")
+
+        precision = "fp16" if half else "fp32"
+        cached = weights.with_name(
+            f"{weights.stem}_{imgsz}_b{max_batch_size}_{precision}{suffix}"
+        )
+        if not cached.exists():
+            exported = Path(YOLO(model_path).export(imgsz=imgsz, **export_args))
+            exported.replace(cached)
+
+        return str(cached)
+
     def detect(
         self,
         frame: Any,
-        filter_classes: Sequence[SemanticClass] | None = None
+        filter_classes: Collection[SemanticClass] | None = None
     ) -> Result[Sequence[Detection], InfrastructureError]:
 
         if not isinstance(frame, np.ndarray):
@@ -34,48 +202,73 @@ class YoloAdapter(DetectorPort):
                     "YoloAdapter requires numpy array as frame input"
                     ))
 
-        try:
-            results = self._model.predict(frame, conf=self._conf_threshold, verbose=False)
-
-            domain_detections: list[Detection] = []
+        return self.detect_batch([frame], filter_classes).map(lambda batch: batch[0])
 
-            for result in results:
-                # Jeśli nic nie wykryto, boxes może być None
-                if result.boxes is None:
-                    continue
+    def detect_batch(
+        self,
+        frames: Sequence[Any],
+        filter_classes: Collection[SemanticClass] | None = None
+    ) -> Result[Sequence[Sequence[Detection]], InfrastructureError]:
+        """Run batched inference on the worker thread and wait for the result."""
+        return self.submit_batch(frames, filter_classes).result()
 
-                boxes_iter = cast("Iterable[Any]", result.boxes)
+    def submit_batch(
+        self,
+        frames: Sequence[Any],
+        filter_classes: Collection[SemanticClass] | None = None
+    ) -> Future[Result[Sequence[Sequence[Detection]], InfrastructureError]]:
+        """Queue batched inference on the adapter's worker thread."""
+        return self._executor.submit(
+            self._detect_batch_impl, list(frames), filter_classes
+        )
 
-                for box in boxes_iter:
-                    coords = box.xyxy[0].tolist()
+    def _detect_batch_impl(
+        self,
+        frames: Sequence[Any],
+        filter_classes: Collection[SemanticClass] | None = None
+    ) -> Result[Sequence[Sequence[Detection]], InfrastructureError]:
+        """
+        Run a single batched inference over all frames, on the worker thread only.
+        Ultralytics stacks same-shaped frames into one tensor, so the per-call
+        overhead (preprocess, kernel launches, NMS setup) is paid once per batch.
+        Detections of each frame are returned as a DetectionBatch, built straight
+        from the model output arrays without per-box objects.
+        """
+        if not all(isinstance(frame, np.ndarray) for frame in frames):
+            return Err(
+                InfrastructureError(
+                    "YoloAdapter requires numpy array as frame input"
+                    ))
 
-                    cls_id = int(box.cls[0].item())
-                    conf = float(box.conf[0].item())
+        if not frames:
+            return Ok([])
 
-                    semantic_label = YoloClassMapper.map_id(cls_id)
+        try:
+            if self._net is not None:
+                outputs = self._infer_direct(frames)
+            else:
+                outputs = self._infer_predict(frames)
 
-                    if filter_classes and semantic_label not in filter_classes:
-                        continue
+            batch_detections: list[DetectionBatch] = []
+            allowed_codes = self._allowed_codes(filter_classes)
 
-                    bbox_result = BoundingBox.create(
-                        x1=coords[0],
-                        y1=coords[1],
-                        x2=coords[2],
-                        y2=coords[3]
-                    )
+            for xyxy, cls_ids, confs in outputs:
+                codes = self._id_to_code[cls_ids.astype(np.intp)]
 
-                    if bbox_result.is_err():
-                        continue
+                # Clamp to frame origin, then drop degenerate boxes in one pass,
+                # so DetectionBatch can build BoundingBoxes without validation
+                np.maximum(xyxy[:, :2], 0, out=xyxy[:, :2])
+                mask = (xyxy[:, 0] < xyxy[:, 2]) & (xyxy[:, 1] < xyxy[:, 3])
+                if allowed_codes is not None:
+                    mask &= np.isin(codes, allowed_codes)
 
-                    detection = Detection(
-                        bbox=bbox_result.unwrap(),
-                        class_label=semantic_label,
-                        confidence=conf,
-                        track_id=None
-                    )
-                    domain_detections.append(detection)
+                batch_detections.append(DetectionBatch(
+                    coords=xyxy[mask],
+                    cls=codes[mask],
+                    conf=confs[mask]
+                ))
 
-            return Ok(domain_detections)
+            return Ok(batch_detections)
 
         except Exception as e:
             return Err(
@@ -83,3 +276,160 @@ class YoloAdapter(DetectorPort):
                     f"Detection infrastructure error: {e!s}"
                 )
             )
+
+    def _infer_predict(
+        self,
+        frames: Sequence[np.ndarray]
+    ) -> list[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """Inference through Ultralytics predict (exported models).
+
+        Returns:
+            (xyxy, class ids, confidences) arrays per frame.
+        """
+        results = self._model.predict(list(frames), **self._predict_args)
+
+        outputs = []
+        for result in results:
+            # Jeśli nic nie wykryto, boxes może być None
+            if result.boxes is None:
+                outputs.append(_empty_output())
+                continue
+
+            # Single device->host transfer of the raw tensor, no Boxes properties.
+            # (N, 6) rows: x1, y1, x2, y2, conf, cls
+            data = result.boxes.data.float().cpu().numpy()
+            outputs.append((data[:, :4], data[:, 5], data[:, 4]))
+        return outputs
+
+    def _infer_direct(
+        self,
+        frames: Sequence[np.ndarray]
+    ) -> list[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """Inference calling the PyTorch module directly.
+
+        Frames are written into a persistent (pinned on CUDA) uint8 host buffer
+        and copied asynchronously into a persistent device buffer, avoiding
+        per-call tensor allocation and pageable-memory copies. Normalization
+        runs on the device, so only one byte per pixel crosses the bus.
+        Same-shaped frames are padded only up to the model stride, like
+        Ultralytics predict does for PyTorch weights (384x640 for 16:9).
+        A compiled module keeps its warmup shape instead, smaller batches
+        run with unused rows.
+
+        Returns:
+            (xyxy, class ids, confidences) arrays per frame, in frame coordinates.
+        """
+        assert self._net is not None
+        rows = len(frames)
+        if self._static_input:
+            input_hw = (self._imgsz, self._imgsz)
+            rows = max(rows, self._max_batch_size)
+        elif len({frame.shape for frame in frames}) == 1:
+            input_hw = _letterbox_shape(frames[0].shape[:2], self._imgsz, self._stride)
+        else:
+            input_hw = (self._imgsz, self._imgsz)
+        host_buf, device_buf = self._input_buffers(rows, input_hw)
+        host = host_buf.numpy()
+        if self._resize_buf.shape[:2] != input_hw:
+            self._resize_buf = np.empty((*input_hw, 3), dtype=np.uint8)
+
+        for i, frame in enumerate(frames):
+            # Letterbox into a reused buffer, then a single split writes channels
+            # in reverse order (BGR -> RGB) straight into CHW planes of the input
+            _letterbox(frame, self._resize_buf, self._imgsz)
+            cv2.split(self._resize_buf, [host[i, 2], host[i, 1], host[i, 0]])
+
+        if device_buf is not host_buf:
+            device_buf.copy_(host_buf, non_blocking=True)
+
+        with torch.inference_mode():
+            images = device_buf.half() if self._half else device_buf.float()
+            preds = self._net(images.div_(255.0))
+            per_frame = non_max_suppression(
+                preds, conf_thres=self._conf_threshold, iou_thres=NMS_IOU
+            )
+
+        outputs = []
+        for frame, det in zip(frames, per_frame[:len(frames)], strict=True):
+            data = det.float().cpu().numpy()  # (N, 6): x1, y1, x2, y2, conf, cls
+            # Undo letterbox padding and scale, clipped to the frame
+            xyxy = cast(
+                "np.ndarray", scale_boxes(input_hw, data[:, :4], frame.shape[:2])
+            )
+            outputs.append((xyxy, data[:, 5], data[:, 4]))
+        return outputs
+
+    def _input_buffers(
+        self,
+        batch_size: int,
+        input_hw: tuple[int, int]
+    ) -> tuple[torch.Tensor, torch.Tensor]:
+        """Return (host, device) input buffers, reallocated only on shape change."""
+        shape = (batch_size, 3, *input_hw)
+        if (
+            self._host_buf is None
+            or self._device_buf is None
+            or self._host_buf.shape != shape
+        ):
+            host = torch.empty(shape, dtype=torch.uint8)
+            if self._device.type == "cuda":
+                self._host_buf = host.pin_memory()
+                self._device_buf = torch.empty(
+                    shape, dtype=torch.uint8, device=self._device
+                )
+            else:
+                self._host_buf = self._device_buf = host
+        return self._host_buf, self._device_buf
+
+    @staticmethod
+    def _allowed_codes(
+        filter_classes: Collection[SemanticClass] | None
+    ) -> np.ndarray | None:
+        """Translate domain filter into class codes, once per call."""
+        if not filter_classes:
+            return None
+        return np.array([CLASS_CODES[label] for label in filter_classes], dtype=np.int8)
+
+
+def _letterbox_shape(
+    frame_hw: tuple[int, ...],
+    imgsz: int,
+    stride: int
+) -> tuple[int, int]:
+    """Smallest stride-aligned input fitting the frame scaled to imgsz,
+    as Ultralytics LetterBox(auto=True) computes it.
+    """
+    height, width = frame_hw
+    ratio = min(imgsz / height, imgsz / width)
+    new_w, new_h = round(width * ratio), round(height * ratio)
+    return new_h + (imgsz - new_h) % stride, new_w + (imgsz - new_w) % stride
+
+
+def _letterbox(frame: np.ndarray, dst: np.ndarray, imgsz: int) -> None:
+    """Resize frame so its longer side fits imgsz keeping aspect ratio, and
+    center it in dst on LETTERBOX_PAD padding. Same geometry as Ultralytics
+    LetterBox, so `scale_boxes` maps detections back to the frame.
+    """
+    height, width = frame.shape[:2]
+    dst_h, dst_w = dst.shape[:2]
+    ratio = min(imgsz / height, imgsz / width)
+    new_w, new_h = round(width * ratio), round(height * ratio)
+    pad_w, pad_h = (dst_w - new_w) / 2, (dst_h - new_h) / 2
+    top, bottom = round(pad_h - 0.1), round(pad_h + 0.1)
+    left, right = round(pad_w - 0.1), round(pad_w + 0.1)
+
+    resized = frame
+    if (new_w, new_h) != (width, height):
+        resized = cv2.resize(frame, (new_w, new_h))
+    cv2.copyMakeBorder(
+        resized, top, bottom, left, right, cv2.BORDER_CONSTANT,
+        dst=dst, value=(LETTERBOX_PAD,) * 3
+    )
+
+
+def _empty_output() -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    return (
+        np.empty((0, 4), dtype=np.float32),
+        np.empty(0, dtype=np.float32),
+        np.empty(0, dtype=np.float32)
+    )
@@ -0,0 +1,53 @@
+from typing import Any
+
+import cv2
+
+
+class CudaVideoReader:
+    """
+    cv2.cudacodec reader exposing the subset of cv2.VideoCapture API used by the CLI.
+    Decodes on the GPU (NVDEC), frames are downloaded to host as BGR arrays.
+    """
+
+    def __init__(self, source: str) -> None:
+        # cudacodec exists only in CUDA builds of OpenCV, absent from its stubs
+        cudacodec = cv2.cudacodec  # type: ignore[attr-defined, unused-ignore]
+        self._reader = cudacodec.createVideoReader(source)
+        self._reader.set(cudacodec.ColorFormat_BGR)
+
+    def isOpened(self) -> bool:
+        return True
+
+    def read(self) -> tuple[bool, Any]:
+        ret, gpu_frame = self._reader.nextFrame()
+        if not ret:
+            return False, None
+        return True, gpu_frame.download()
+
+    def release(self) -> None:
+        self._reader = None
+
+
+def open_capture(source: str | int) -> Any:
+    """
+    Open video source with the lowest latency backend available.
+
+    Files and streams try GPU decoding first, then FFmpeg. Cameras use the
+    default backend. Capture buffer is limited to one frame so reads always
+    return the newest frame instead of a queued backlog.
+
+    Returns:
+        Object with cv2.VideoCapture compatible read/isOpened/release.
+    """
+    if isinstance(source, int):
+        cap = cv2.VideoCapture(source)
+    else:
+        try:
+            if cv2.cuda.getCudaEnabledDeviceCount() > 0:
+                return CudaVideoReader(source)
+        except (AttributeError, cv2.error):
+            pass  # OpenCV built without CUDA / cudacodec
+        cap = cv2.VideoCapture(source, cv2.CAP_FFMPEG)
+
+    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+    return cap
@@ -1,16 +1,157 @@
 import argparse
+import queue
 import sys
+from collections.abc import Sequence
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any
 
 import cv2  # type: ignore
 from detection_platform.application.services.detection_service import DetectionService
-from detection_platform.infrastructure.adapters.detection.yolo_adapter import YoloAdapter
-
+from detection_platform.infrastructure.adapters.detection.yolo_adapter import (
+    IMGSZ,
+    YoloAdapter,
+)
+from detection_platform.presentation.cli.capture import open_capture
+from detection_platform.presentation.cli.pipeline import (
+    END_OF_STREAM,
+    DrawThread,
+    ReaderThread,
+    put_drop_oldest,
+)
+from shared_kernel.detection_core.domain.detection import Detection
+from shared_kernel.exceptions import DomainError
+from shared_kernel.result_monad import Result
+
+# Max frames buffered between pipeline stages
+QUEUE_SIZE = 3
+WINDOW_NAME = 'Detection Platform CLI'
+
+
+@dataclass(frozen=True, slots=True)
+class _InFlightBatch:
+    """Batch submitted to the detector, waiting to be forwarded to the drawer."""
+    groups: list[list[Any]]
+    future: Future[Result[Sequence[Sequence[Detection]], DomainError]]
+
+
+def _submit_groups(
+    service: DetectionService,
+    groups: list[list[Any]]
+) -> _InFlightBatch:
+    """Submit the first frame of every group for detection without blocking.
+    Remaining frames of a group reuse detections of its first frame."""
+    future = service.submit_objects_batch([group[0] for group in groups])
+    return _InFlightBatch(groups=groups, future=future)
+
+
+def _forward_detections(batch: _InFlightBatch, q_out: "queue.Queue[Any]") -> None:
+    """Wait for batch result and hand (frame, detections) pairs to the drawer."""
+    result = batch.future.result()
+
+    per_group: Sequence[Sequence[Detection]]
+    if result.is_ok():
+        per_group = result.unwrap()
+    else:
+        print(f"Detection error: {result.unwrap_err()}")
+        per_group = [[] for _ in batch.groups]
+
+    for group, detections in zip(batch.groups, per_group, strict=True):
+        for frame in group:
+            put_drop_oldest(q_out, (frame, detections))
+
+
+def _show_drawn(q_show: "queue.Queue[Any]") -> bool:
+    """Show every frame drawn so far, one GUI event pass per frame.
+    GUI events are processed even when nothing new is drawn.
+
+    Returns:
+        True if the user pressed 'q'.
+    """
+    while True:
+        try:
+            frame = q_show.get_nowait()
+        except queue.Empty:
+            frame = None
+        if frame is not None:
+            cv2.imshow(WINDOW_NAME, frame)
+        if cv2.waitKey(1) & 0xFF == ord('q'):
+            return True
+        if frame is None:
+            return False
+
+
+def _run_pipeline(
+    service: DetectionService,
+    q_in: "queue.Queue[Any]",
+    q_out: "queue.Queue[Any]",
+    q_show: "queue.Queue[Any]",
+    *,
+    batch_size: int,
+    detect_every: int
+) -> bool:
+    """Batch frames from the reader, detect and forward them to the drawer
+    until the stream ends.
+
+    Returns:
+        True if the user pressed 'q'.
+    """
+    # Each group starts with a frame sent to the detector, followed by
+    # skipped frames rendered with its detections
+    groups: list[list[Any]] = []
+    frame_idx = 0
+    # Next batch is submitted before waiting on the previous one,
+    # keeping one inference in flight while results are forwarded
+    in_flight: _InFlightBatch | None = None
 
-def run_detection(source: str | int, model_path: str) -> None:
+    while True:
+        frame = q_in.get()
+        if frame is not END_OF_STREAM:
+            if frame_idx % detect_every == 0:
+                groups.append([frame])
+            else:
+                groups[-1].append(frame)
+            frame_idx += 1
+
+        # Frames from one capture share HxW, so the model can stack them as-is
+        batch_full = len(groups) == batch_size and len(groups[-1]) == detect_every
+        if groups and (batch_full or frame is END_OF_STREAM):
+            submitted = _submit_groups(service, groups)
+            if in_flight is not None:
+                _forward_detections(in_flight, q_out)
+            in_flight = submitted
+            groups = []
+
+        if frame is END_OF_STREAM:
+            if in_flight is not None:
+                _forward_detections(in_flight, q_out)
+            return False
+
+        # GUI calls stay on the main thread
+        if _show_drawn(q_show):
+            return True
+
+
+def run_detection(
+    source: str | int,
+    model_path: str,
+    *,
+    batch_size: int = 1,
+    half: bool = False,
+    accelerate: bool = False,
+    detect_every: int = 1,
+    infer_size: int = IMGSZ
+) -> None:
     # 1. Infrastructure Setup (Adapter)
     try:
         print(f"Loading model from: {model_path}")
-        adapter = YoloAdapter(model_path=model_path)
+        adapter = YoloAdapter(
+            model_path=model_path,
+            half=half,
+            accelerate=accelerate,
+            max_batch_size=batch_size,
+            imgsz=infer_size
+        )
     except Exception as e:
         print(f"Error initializing infrastructure: {e}")
         sys.exit(1)
@@ -19,40 +160,39 @@ def run_detection(source: str | int, model_path: str) -> None:
     service = DetectionService(detector=adapter)
 
     # 3. Execution (Simple Video Loop - Presentation Logic)
-    cap = cv2.VideoCapture(source)
+    cap = open_capture(source)
     if not cap.isOpened():
         print(f"Cannot open video source: {source}")
         sys.exit(1)
 
     print(f"Starting detection on: {source} (Press 'q' to exit)")
 
-    while True:
-        ret, frame = cap.read()
-        if not ret:
-            break
-
-        result = service.detect_objects(frame)
-
-        if result.is_ok():
-            detections = result.unwrap()
-            
-            for det in detections:
-                bbox = det.bbox
-                x1, y1 = int(bbox.x1), int(bbox.y1)
-                x2, y2 = int(bbox.x2), int(bbox.y2)
-
-                label_text = f"{det.class_label.value}: {det.confidence:.2f}"
-
-                cv2.rectangle(frame, (x1, y1), (x2, y2), (0, 255, 0), 2)
-                cv2.putText(frame, label_text, (x1, y1 - 10),
-                            cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
-        else:
-            print(f"Detection error: {result.unwrap_err()}")
-
-        cv2.imshow('Detection Platform CLI', frame)
-        
-        if cv2.waitKey(1) & 0xFF == ord('q'):
-            break
+    # 4. Pipeline: reader thread -> inference (main thread) -> draw thread
+    queue_size = max(QUEUE_SIZE, batch_size * detect_every)
+    q_in: queue.Queue[Any] = queue.Queue(maxsize=queue_size)
+    q_out: queue.Queue[Any] = queue.Queue(maxsize=queue_size)
+    # Drawer receives whole batches at once, the display loop shows every frame.
+    # Room for two: at end of stream the in-flight and last batch arrive together
+    q_show: queue.Queue[Any] = queue.Queue(maxsize=2 * queue_size)
+
+    reader = ReaderThread(cap, q_in)
+    drawer = DrawThread(q_out, q_show)
+    reader.start()
+    drawer.start()
+
+    quit_requested = _run_pipeline(
+        service, q_in, q_out, q_show,
+        batch_size=batch_size, detect_every=detect_every
+    )
+
+    reader.stop()
+    adapter.close()
+    q_out.put(END_OF_STREAM)
+    # Frames of the last batches are drawn after the loop ends
+    while not quit_requested and (drawer.is_alive() or not q_show.empty()):
+        quit_requested = _show_drawn(q_show)
+    drawer.join()
+    reader.join(timeout=1.0)
 
     cap.release()
     cv2.destroyAllWindows()
@@ -64,13 +204,32 @@ def app() -> None:
 
     parser.add_argument("source", type=str, help="Path to video file or camera index (0)")
     parser.add_argument("--model", type=str, default="yolov8n.pt", help="Path to YOLO model weights")
+    parser.add_argument("--batch-size", type=int, default=1,
+                        help="Frames per inference batch")
+    parser.add_argument("--detect-every", type=int, default=1,
+                        help="Run detection on every Nth frame, "
+                             "reuse last result in between")
+    parser.add_argument("--infer-size", type=int, default=IMGSZ,
+                        help="Model input size (longer side), smaller runs faster")
+    parser.add_argument("--half", action="store_true",
+                        help="FP16 inference (CUDA only)")
+    parser.add_argument("--accelerate", action="store_true",
+                        help="Export .pt to TensorRT (CUDA) / ONNX (CPU) and use it")
 
     args = parser.parse_args()
 
     # Obsługa "0" jako kamery internetowej (konwersja str -> int dla OpenCV)
     source: str | int = 0 if args.source == "0" else args.source
 
-    run_detection(source, args.model)
+    run_detection(
+        source,
+        args.model,
+        batch_size=max(1, args.batch_size),
+        half=args.half,
+        accelerate=args.accelerate,
+        detect_every=max(1, args.detect_every),
+        infer_size=args.infer_size
+    )
 
 
 if __name__ == "__main__":
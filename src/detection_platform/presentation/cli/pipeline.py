@@ -0,0 +1,109 @@
+import contextlib
+import queue
+import threading
+from collections.abc import Sequence
+from typing import Any
+
+import cv2  # type: ignore
+import numpy as np
+
+from shared_kernel.detection_core.domain.detection import Detection
+from shared_kernel.detection_core.domain.detection_batch import (
+    SEMANTIC_CLASSES,
+    DetectionBatch,
+)
+
+# Sentinel pushed through the queues to signal end of stream.
+END_OF_STREAM = None
+
+# "<label>: " prefix per class code, built once instead of per drawn detection.
+# Kept as str: cv2.putText does not accept bytes.
+_LABEL_PREFIX: tuple[str, ...] = tuple(f"{label.value}: " for label in SEMANTIC_CLASSES)
+
+
+def put_drop_oldest(q: "queue.Queue[Any]", item: Any) -> None:
+    """Put item into bounded queue, discarding the oldest entry when full.
+
+    Mirrors the "last available frame" policy: consumers always see the
+    freshest data instead of blocking producers on a stale backlog.
+    """
+    while True:
+        try:
+            q.put_nowait(item)
+            return
+        except queue.Full:
+            with contextlib.suppress(queue.Empty):
+                q.get_nowait()
+
+
+class ReaderThread(threading.Thread):
+    """
+    Reads frames from a capture device into a bounded queue.
+    Keeps the capture device busy while inference runs on the main thread.
+    """
+
+    def __init__(self, cap: Any, q_in: "queue.Queue[Any]") -> None:
+        super().__init__(name="frame-reader", daemon=True)
+        self._cap = cap
+        self._q_in = q_in
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        while not self._stop_event.is_set():
+            ret, frame = self._cap.read()
+            if not ret:
+                break
+            put_drop_oldest(self._q_in, frame)
+        # End of stream must not be dropped, block until consumer makes room
+        self._q_in.put(END_OF_STREAM)
+
+    def stop(self) -> None:
+        self._stop_event.set()
+
+
+class DrawThread(threading.Thread):
+    """
+    Draws detections on frames off the main thread.
+    Only drawing happens here - cv2.imshow/waitKey stay on the main thread,
+    as most GUI backends require.
+    """
+
+    def __init__(
+        self,
+        q_out: "queue.Queue[Any]",
+        q_show: "queue.Queue[Any]"
+    ) -> None:
+        super().__init__(name="frame-drawer", daemon=True)
+        self._q_out = q_out
+        self._q_show = q_show
+
+    def run(self) -> None:
+        while True:
+            item = self._q_out.get()
+            if item is END_OF_STREAM:
+                break
+            frame, detections = item
+            draw_detections(frame, detections)
+            put_drop_oldest(self._q_show, frame)
+
+
+def draw_detections(frame: Any, detections: Sequence[Detection]) -> None:
+    """Draw bounding boxes and labels in place on the frame.
+
+    Coordinates are truncated to int for the whole batch in one NumPy call,
+    the loop only unpacks ready Python ints for cv2.
+    """
+    if not isinstance(detections, DetectionBatch):
+        detections = DetectionBatch.from_detections(detections)
+    if not len(detections):
+        return
+
+    rects = detections.coords.astype(np.int32).tolist()
+    for (x1, y1, x2, y2), code, conf in zip(
+        rects, detections.cls.tolist(), detections.conf.tolist(), strict=True
+    ):
+        label_text = _LABEL_PREFIX[code] + f"{conf:.2f}"
+
+        cv2.rectangle(frame, (x1, y1), (x2, y2), (0, 255, 0), 2)
+        cv2.putText(frame, label_text, (x1, y1 - 10),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Self
 
 from shared_kernel.semantic_model.labels import SemanticClass
 from shared_kernel.value_objects import BoundingBox
@@ -8,6 +9,8 @@ from shared_kernel.value_objects import BoundingBox
 class Detection:
     """
     Represents detected object in a frame.
+    Confidence is validated only in debug mode, production runs
+    use `python -O` to skip the check.
 
     Attributes:
         bbox (BoundingBox): Spatial location.
@@ -21,11 +24,29 @@ class Detection:
     track_id: str | None = None
 
     def __post_init__(self) -> None:
-        if not (0.0 <= self.confidence <= 1.0):
+        if __debug__ and not (0.0 <= self.confidence <= 1.0):
             raise ValueError(
                 f"Confidence {self.confidence} must be between 0.0 and 1.0"
                 )
 
+    @classmethod
+    def _unchecked(
+        cls,
+        bbox: BoundingBox,
+        class_label: SemanticClass,
+        confidence: float,
+        track_id: str | None = None
+    ) -> Self:
+        """Create Detection without running validation.
+        Only for values already known to be valid (ex. rows of a DetectionBatch).
+        """
+        det = object.__new__(cls)
+        object.__setattr__(det, "bbox", bbox)
+        object.__setattr__(det, "class_label", class_label)
+        object.__setattr__(det, "confidence", confidence)
+        object.__setattr__(det, "track_id", track_id)
+        return det
+
     @property
     def area(self) -> float:
         return self.bbox.area
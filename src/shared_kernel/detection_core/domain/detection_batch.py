@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from typing import cast, overload
+
+import numpy as np
+
+from shared_kernel.detection_core.domain.detection import Detection
+from shared_kernel.semantic_model.labels import SemanticClass
+from shared_kernel.value_objects import BoundingBox
+from shared_kernel.value_objects.bounding_box_ops import iou_matrix
+
+# Class codes stored in DetectionBatch.cls are indexes into this tuple
+SEMANTIC_CLASSES: tuple[SemanticClass, ...] = tuple(SemanticClass)
+CLASS_CODES: dict[SemanticClass, int] = {
+    label: code for code, label in enumerate(SEMANTIC_CLASSES)
+}
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class DetectionBatch(Sequence[Detection]):
+    """
+    Detections of a single frame stored as columns (structure of arrays).
+
+    Keeps detector output in NumPy arrays so geometric operations run
+    vectorized. Indexing returns a `Detection` view built on demand.
+    Coordinates are trusted to satisfy BoundingBox invariants, producers
+    are responsible for masking out invalid rows.
+
+    Attributes:
+        coords (np.ndarray): (N, 4) float32 array of x1, y1, x2, y2.
+        cls (np.ndarray): (N,) int array of class codes (see SEMANTIC_CLASSES).
+        conf (np.ndarray): (N,) float32 array of confidences (0.0 - 1.0).
+    """
+    coords: np.ndarray
+    cls: np.ndarray
+    conf: np.ndarray
+
+    def __post_init__(self) -> None:
+        n = len(self.coords)
+        shapes = (self.coords.shape, self.cls.shape, self.conf.shape)
+        if shapes != ((n, 4), (n,), (n,)):
+            raise ValueError(
+                f"Inconsistent batch shapes: coords {self.coords.shape}, "
+                f"cls {self.cls.shape}, conf {self.conf.shape}"
+            )
+
+    """
+    Factory methods
+    """
+    @classmethod
+    def empty(cls) -> DetectionBatch:
+        """Create batch without detections."""
+        return cls(
+            coords=np.empty((0, 4), dtype=np.float32),
+            cls=np.empty(0, dtype=np.int8),
+            conf=np.empty(0, dtype=np.float32)
+        )
+
+    @classmethod
+    def from_detections(cls, detections: Sequence[Detection]) -> DetectionBatch:
+        """Pack Detection objects into columns."""
+        if not detections:
+            return cls.empty()
+        return cls(
+            coords=np.array(
+                [det.bbox.to_tuple() for det in detections], dtype=np.float32
+            ),
+            cls=np.array(
+                [CLASS_CODES[det.class_label] for det in detections], dtype=np.int8
+            ),
+            conf=np.array([det.confidence for det in detections], dtype=np.float32)
+        )
+
+    """
+    Sequence protocol
+    """
+    def __len__(self) -> int:
+        return len(self.conf)
+
+    @overload
+    def __getitem__(self, index: int) -> Detection: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> DetectionBatch: ...
+
+    def __getitem__(self, index: int | slice) -> Detection | DetectionBatch:
+        if isinstance(index, slice):
+            return DetectionBatch(
+                coords=self.coords[index], cls=self.cls[index], conf=self.conf[index]
+            )
+        x1, y1, x2, y2 = self.coords[index].tolist()
+        return Detection._unchecked(
+            BoundingBox._unchecked(x1, y1, x2, y2),
+            SEMANTIC_CLASSES[int(self.cls[index])],
+            float(self.conf[index])
+        )
+
+    def __iter__(self) -> Iterator[Detection]:
+        for i in range(len(self)):
+            yield self[i]
+
+    """
+    Vectorized operations
+    """
+    def filter(self, mask: np.ndarray) -> DetectionBatch:
+        """Return new batch with rows selected by boolean mask."""
+        return DetectionBatch(
+            coords=self.coords[mask], cls=self.cls[mask], conf=self.conf[mask]
+        )
+
+    @property
+    def labels(self) -> list[SemanticClass]:
+        """SemanticClass of every detection."""
+        return [SEMANTIC_CLASSES[code] for code in self.cls.tolist()]
+
+    @property
+    def areas(self) -> np.ndarray:
+        """(N,) areas of all boxes."""
+        return box_areas(self.coords)
+
+    def iou_matrix(self, other: DetectionBatch) -> np.ndarray:
+        """(N, M) IoU between boxes of this and other batch."""
+        return iou_matrix(self.coords, other.coords)
+
+
+def box_areas(coords: np.ndarray) -> np.ndarray:
+    """Areas of (N, 4) x1, y1, x2, y2 boxes."""
+    widths = coords[:, 2] - coords[:, 0]
+    heights = coords[:, 3] - coords[:, 1]
+    return cast("np.ndarray", widths * heights)
+
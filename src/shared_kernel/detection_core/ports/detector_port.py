@@ -1,9 +1,10 @@
 from abc import ABC, abstractmethod
-from collections.abc import Sequence
+from collections.abc import Collection, Sequence
+from concurrent.futures import Future
 from typing import Any
 
 from shared_kernel.detection_core.domain.detection import Detection
-from shared_kernel.result_monad import Result
+from shared_kernel.result_monad import Err, Ok, Result
 from shared_kernel.semantic_model.labels import SemanticClass
 from shared_kernel.exceptions import DomainError
 
@@ -18,7 +19,7 @@ class DetectorPort(ABC):
     def detect(
         self,
         frame: Any, # Abstracted image (could be numpy arr in implementation)
-        filter_classes: Sequence[SemanticClass] | None = None
+        filter_classes: Collection[SemanticClass] | None = None
     ) -> Result[Sequence[Detection], DomainError]:
         """
         Perform detection on the given frame.
@@ -30,3 +31,50 @@ class DetectorPort(ABC):
             Result containing list of Detections or erro message.
         """
         ...
+
+    def detect_batch(
+        self,
+        frames: Sequence[Any],
+        filter_classes: Collection[SemanticClass] | None = None
+    ) -> Result[Sequence[Sequence[Detection]], DomainError]:
+        """
+        Perform detection on several frames at once.
+
+        Default implementation calls `detect` per frame. Adapters backed by
+        batching-capable models should override it with a single call.
+
+        Args:
+            frames: Input frames, expected to share the same shape.
+            filter_classes: Optional list of classes to include. If None return All.
+        Returns:
+            Result containing list of Detections per frame (same order as input).
+        """
+        batch: list[Sequence[Detection]] = []
+        for frame in frames:
+            result = self.detect(frame, filter_classes)
+            if result.is_err():
+                return Err(result.unwrap_err())
+            batch.append(result.unwrap())
+        return Ok(batch)
+
+    def submit_batch(
+        self,
+        frames: Sequence[Any],
+        filter_classes: Collection[SemanticClass] | None = None
+    ) -> Future[Result[Sequence[Sequence[Detection]], DomainError]]:
+        """
+        Start detection on several frames without waiting for the result.
+
+        Default implementation runs `detect_batch` synchronously and returns
+        a completed Future. Adapters owning a worker should override it, so
+        inference overlaps with the caller's pre/post-processing.
+
+        Args:
+            frames: Input frames, expected to share the same shape.
+            filter_classes: Optional list of classes to include. If None return All.
+        Returns:
+            Future resolving to the same Result as `detect_batch`.
+        """
+        future: Future[Result[Sequence[Sequence[Detection]], DomainError]] = Future()
+        future.set_result(self.detect_batch(frames, filter_classes))
+        return future
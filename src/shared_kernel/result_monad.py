@@ -3,7 +3,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from collections.abc import Callable
 from dataclasses import dataclass
-from typing import Generic, TypeVar, Union, cast, final
+from typing import Any, ClassVar, Generic, TypeVar, Union, cast, final
 
 # T - Success type (ex. BoundingBox)
 # E - Error type (ex. InvalidBoundingBoxError)
@@ -19,9 +19,27 @@ class ResultError(Exception):
     pass
 
 class Result(ABC, Generic[T, E]):
-    """Monad Result representing success (Ok) or failure (Err)."""
+    """Monad Result representing success (Ok) or failure (Err).
+
+    `ok` is a plain class attribute tag, hot paths can branch on `res.ok`
+    without the `is_ok()` method call.
+    """
 
     __slots__ = ()
+    ok: ClassVar[bool]
+
+    """
+    Shared instances
+    """
+    @staticmethod
+    def ok_none() -> Result[None, Any]:
+        """Return the shared Ok(None), for stages without a success value."""
+        return _OK_NONE
+
+    @staticmethod
+    def ok_bool(value: bool) -> Result[bool, Any]:
+        """Return the shared Ok(True) or Ok(False)."""
+        return _OK_TRUE if value else _OK_FALSE
 
     @abstractmethod
     def is_ok(self) -> bool: ...
@@ -74,6 +92,11 @@ class Result(ABC, Generic[T, E]):
     def or_else(self, fn: Callable[[E], Result[T, F]]) -> Result[T, F]:
         """Handles function returning Result."""
         ...
+    @abstractmethod
+    def pipe(self, *fns: Callable[[Any], Result[Any, E]]) -> Result[Any, E]:
+        """Chain of flat_map in one call, stops at the first Err."""
+        ...
+
     # Aliases
     def bind(self, fn: Callable[[T], Result[U, E]]) -> Result[U, E]:
         return self.flat_map(fn)
@@ -92,6 +115,7 @@ class Result(ABC, Generic[T, E]):
 @dataclass(frozen=True, slots=True)
 class Ok(Result[T, E]):
     """Represents a successful result."""
+    ok: ClassVar[bool] = True
     value: T
 
     def is_ok(self) -> bool: return True
@@ -113,6 +137,14 @@ class Ok(Result[T, E]):
 
     def or_else(self, fn: Callable[[E], Result[T, F]]) -> Result[T, F]: return cast("Result[T, F]", self)
 
+    def pipe(self, *fns: Callable[[Any], Result[Any, E]]) -> Result[Any, E]:
+        res: Result[Any, E] = self
+        for fn in fns:
+            res = fn(res.unwrap())
+            if not res.ok:
+                break
+        return res
+
     def inspect(self, fn: Callable[[T], None]) -> Result[T, E]:
         fn(self.value)
         return self
@@ -125,6 +157,7 @@ class Ok(Result[T, E]):
 @dataclass(frozen=True, slots=True)
 class Err(Result[T, E]):
     """Represents a failed result."""
+    ok: ClassVar[bool] = False
     error: E
 
     def is_ok(self) -> bool: return False
@@ -145,6 +178,9 @@ class Err(Result[T, E]):
 
     def or_else(self, fn: Callable[[E], Result[T, F]]) -> Result[T, F]: return fn(self.error)
 
+    def pipe(self, *_fns: Callable[[Any], Result[Any, E]]) -> Result[Any, E]:
+        return self
+
     def inspect(self, fn: Callable[[T], None]) -> Result[T, E]:
         return self
 
@@ -154,5 +190,10 @@ class Err(Result[T, E]):
 
     def __repr__(self) -> str: return f"Err({self.error})"
 
+# Immutable payloads, so one instance each can be shared by every caller
+_OK_NONE: Ok[None, Any] = Ok(None)
+_OK_TRUE: Ok[bool, Any] = Ok(True)
+_OK_FALSE: Ok[bool, Any] = Ok(False)
+
 # Aliases for easier usage
 ResultType = Union[Ok[T, E], Err[T, E]]
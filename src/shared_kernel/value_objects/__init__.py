@@ -1,8 +1,9 @@
-from .bounding_box import BoundingBox, InvalidBoundingBoxError
+from .bounding_box import BBoxErr, BoundingBox, InvalidBoundingBoxError
 from .point import Point
 from .velocity import Velocity
 
 __all__ = [
+    "BBoxErr",
     "BoundingBox",
     "InvalidBoundingBoxError",
     "Point",
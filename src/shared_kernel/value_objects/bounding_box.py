@@ -1,17 +1,62 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Self
+from enum import IntEnum
+from itertools import chain
+from typing import TYPE_CHECKING, Self
+
+import numpy as np
 
 from shared_kernel.exceptions import DomainError
 from shared_kernel.result_monad import Err, Ok, Result
 
+from .bounding_box_ops import (
+    center_distance,
+    edge_distance,
+    iou,
+    iou_matrix,
+    iou_pairwise,
+)
 from .point import Point
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+class BBoxErr(IntEnum):
+    """Error codes of `BoundingBox.try_create_fast`, no message formatting."""
+    OK = 0
+    INVERTED_X = 1
+    INVERTED_Y = 2
+    NEGATIVE_X = 3
+    NEGATIVE_Y = 4
+
+_BBOX_ERR_MESSAGES: dict[BBoxErr, str] = {
+    BBoxErr.INVERTED_X: "x1 ({}) must be less than x2 ({})",
+    BBoxErr.INVERTED_Y: "y1 ({}) must be less than y2 ({})",
+    BBoxErr.NEGATIVE_X: "x1 ({}) must be non-negative",
+    BBoxErr.NEGATIVE_Y: "y1 ({}) must be non-negative",
+}
 
 class InvalidBoundingBoxError(DomainError):
-    """Raised when bounding box coordinates violate invariants."""
-    pass
+    """Raised when bounding box coordinates violate invariants.
+    Stores the error code and offending values, the message is formatted
+    only when the error is converted to str.
+    A plain message may be passed instead of a code, as with other errors.
+    Attributes:
+        code (BBoxErr | str): Violated invariant, or the plain message.
+        values (tuple[float, ...]): Coordinates quoted in the message.
+    """
+
+    def __init__(self, code: BBoxErr | str, *values: float) -> None:
+        super().__init__(code, *values)
+        self.code = code
+        self.values = values
+
+    def __str__(self) -> str:
+        if isinstance(self.code, BBoxErr):
+            return _BBOX_ERR_MESSAGES[self.code].format(*self.values)
+        return super().__str__()
 
 @dataclass(frozen=True, slots=True)
 class BoundingBox:
@@ -29,24 +74,24 @@ class BoundingBox:
     y2: float
 
     def __post_init__(self) -> None:
-        """Validate bounding box invariants after initialization."""
-        if self.x1 >= self.x2:
-            raise InvalidBoundingBoxError(
-                f"x1 ({self.x1}) must be less than x2 ({self.x2})"
-            )
-        if self.y1 >= self.y2:
-            raise InvalidBoundingBoxError(
-                f"y1 ({self.y1}) must be less than y2 ({self.y2})"
-            )
-
-        if self.x1 < 0:
-            raise InvalidBoundingBoxError(
-                f"x1 ({self.x1}) must be non-negative"
-            )
-        if self.y1 < 0:
-            raise InvalidBoundingBoxError(
-                f"y1 ({self.y1}) must be non-negative"
-            )
+        """Validate bounding box invariants after initialization.
+        Skipped under `python -O`, `create` validates regardless.
+        """
+        if __debug__:
+            self._validate(self.x1, self.y1, self.x2, self.y2)
+
+    @staticmethod
+    def _validate(x1: float, y1: float, x2: float, y2: float) -> None:
+        """Raise InvalidBoundingBoxError if coordinates violate invariants."""
+        if x1 >= x2:
+            raise InvalidBoundingBoxError(BBoxErr.INVERTED_X, x1, x2)
+        if y1 >= y2:
+            raise InvalidBoundingBoxError(BBoxErr.INVERTED_Y, y1, y2)
+
+        if x1 < 0:
+            raise InvalidBoundingBoxError(BBoxErr.NEGATIVE_X, x1)
+        if y1 < 0:
+            raise InvalidBoundingBoxError(BBoxErr.NEGATIVE_Y, y1)
 
     """
     Factory methods
@@ -59,10 +104,32 @@ class BoundingBox:
             Ok(BoundingBox) if valid, otherwise Err(str) with error message.
         """
         try:
-            return Ok(cls(x1=x1, y1=y1, x2=x2, y2=y2))
+            cls._validate(x1, y1, x2, y2)
         except InvalidBoundingBoxError as e:
             return(Err(str(e)))
+        return Ok(cls._unchecked(x1, y1, x2, y2))
         
+    @classmethod
+    def try_create_fast(
+        cls, x1: float, y1: float, x2: float, y2: float
+    ) -> tuple[Self | None, BBoxErr]:
+        """
+        Create BoundingBox for hot paths, without Result, exception
+        or message allocation. Checks run in the same order as `create`.
+        Returns:
+            (BoundingBox, BBoxErr.OK) if valid, otherwise
+            (None, code of the first violation).
+        """
+        if x1 >= x2:
+            return None, BBoxErr.INVERTED_X
+        if y1 >= y2:
+            return None, BBoxErr.INVERTED_Y
+        if x1 < 0:
+            return None, BBoxErr.NEGATIVE_X
+        if y1 < 0:
+            return None, BBoxErr.NEGATIVE_Y
+        return cls._unchecked(x1, y1, x2, y2), BBoxErr.OK
+
     @classmethod
     def from_coordinates(cls, coords: tuple[float, float, float, float]) -> Self:
         """Create BoundingBox from a tuple of coordinates.
@@ -74,6 +141,19 @@ class BoundingBox:
         x1, y1, x2, y2 = coords
         return cls(x1=x1, y1=y1, x2=x2, y2=y2)
 
+    @classmethod
+    def _unchecked(cls, x1: float, y1: float, x2: float, y2: float) -> Self:
+        """Create BoundingBox without running validation.
+        Only for coordinates already known to satisfy the invariants
+        (ex. detector output clamped and masked in bulk).
+        """
+        bbox = object.__new__(cls)
+        object.__setattr__(bbox, "x1", x1)
+        object.__setattr__(bbox, "y1", y1)
+        object.__setattr__(bbox, "x2", x2)
+        object.__setattr__(bbox, "y2", y2)
+        return bbox
+
     "May add more factory methods in the future"
 
     """
@@ -126,6 +206,23 @@ class BoundingBox:
         """
         return (self.x1, self.y1, self.x2, self.y2)
 
+    @staticmethod
+    def stack(bboxes: Iterable[BoundingBox]) -> np.ndarray:
+        """Pack bounding boxes into one C-contiguous array for batch operations
+        (ex. `iou_batch`, `iou_matrix`).
+        Args:
+            bboxes: Bounding boxes to pack.
+        Returns:
+            (N, 4) float32 array of x1, y1, x2, y2.
+        """
+        coords = np.fromiter(
+            chain.from_iterable(
+                (bbox.x1, bbox.y1, bbox.x2, bbox.y2) for bbox in bboxes
+            ),
+            dtype=np.float32
+        )
+        return coords.reshape(-1, 4)
+
     """ May add more conversion methods in the future """
 
     """
@@ -143,21 +240,33 @@ class BoundingBox:
             - 0.0 means no overlap.
             - 1.0 means identical boxes.
         """
-        # Calculate intersection coordinates
-        inter_x1 = max(self.x1, other.x1)
-        inter_y1 = max(self.y1, other.y1)
-        inter_x2 = min(self.x2, other.x2)
-        inter_y2 = min(self.y2, other.y2)
-
-        # Check if there's no intersection
-        if inter_x2 <= inter_x1 or inter_y2 <= inter_y1:
-            return 0.0
+        return iou(
+            self.x1, self.y1, self.x2, self.y2,
+            other.x1, other.y1, other.x2, other.y2
+        )
 
-        # Calculate areas
-        intersection_area = (inter_x2 - inter_x1) * (inter_y2 - inter_y1)
-        union_area = self.area + other.area - intersection_area
+    @staticmethod
+    def iou_batch(boxes_a: np.ndarray, boxes_b: np.ndarray) -> np.ndarray:
+        """Calculate IoU of many box pairs at once, vectorized over rows.
+        Args:
+            boxes_a (np.ndarray): (N, 4) array of x1, y1, x2, y2.
+            boxes_b (np.ndarray): (N, 4) array of x1, y1, x2, y2.
+        Returns:
+            (N,) float32 array, IoU of boxes_a[i] and boxes_b[i].
+        """
+        return iou_pairwise(boxes_a, boxes_b)
 
-        return intersection_area / union_area
+    @staticmethod
+    def iou_matrix(boxes_a: np.ndarray, boxes_b: np.ndarray) -> np.ndarray:
+        """Calculate IoU of every box in boxes_a with every box in boxes_b.
+        Ex. N detections against M tracks, without N * M Python calls.
+        Args:
+            boxes_a (np.ndarray): (N, 4) array of x1, y1, x2, y2.
+            boxes_b (np.ndarray): (M, 4) array of x1, y1, x2, y2.
+        Returns:
+            (N, M) float32 array, IoU of boxes_a[i] and boxes_b[j].
+        """
+        return iou_matrix(boxes_a, boxes_b)
 
     def intersection(self, other: Self) -> BoundingBox | None:
         """Calculate the intersection bounding box with another bounding box.
@@ -175,7 +284,8 @@ class BoundingBox:
         if inter_x2 <= inter_x1 or inter_y2 <= inter_y1:
             return None  # No intersection
 
-        return BoundingBox(x1=inter_x1, y1=inter_y1, x2=inter_x2, y2=inter_y2)
+        # Non-empty overlap of two valid boxes is valid, skip re-validation
+        return BoundingBox._unchecked(inter_x1, inter_y1, inter_x2, inter_y2)
 
     def contains_point(self, x: float, y: float) -> bool:
         """Check if the bounding box contains a given point.
@@ -187,6 +297,16 @@ class BoundingBox:
         """
         return self.x1 <= x <= self.x2 and self.y1 <= y <= self.y2
 
+    def contains_points(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """Vectorized `contains_point` for many points at once.
+        Args:
+            xs (np.ndarray): x-coordinates of the points.
+            ys (np.ndarray): y-coordinates of the points, same shape as xs.
+        Returns:
+            Boolean array, True where the point is inside the bounding box.
+        """
+        return (xs >= self.x1) & (xs <= self.x2) & (ys >= self.y1) & (ys <= self.y2)
+
     def contains_box(self, other: Self) -> bool:
         """Check if the bounding box fully contains another bounding box.
         Args:
@@ -208,11 +328,28 @@ class BoundingBox:
         Returns:
             True if the bounding boxes overlap, False otherwise.
         """
-        return not (
-            self.x2 <= other.x1 or
-            self.x1 >= other.x2 or
-            self.y2 <= other.y1 or
-            self.y1 >= other.y2
+        # Bitwise & evaluates all four comparisons without short-circuit jumps
+        return (
+            (self.x1 < other.x2) &
+            (other.x1 < self.x2) &
+            (self.y1 < other.y2) &
+            (other.y1 < self.y2)
+        )
+
+    @staticmethod
+    def overlaps_batch(boxes_a: np.ndarray, boxes_b: np.ndarray) -> np.ndarray:
+        """Vectorized `overlaps` for many box pairs at once.
+        Args:
+            boxes_a (np.ndarray): (N, 4) array of x1, y1, x2, y2.
+            boxes_b (np.ndarray): (N, 4) array of x1, y1, x2, y2.
+        Returns:
+            (N,) boolean array, True where boxes_a[i] overlaps boxes_b[i].
+        """
+        return (
+            (boxes_a[:, 0] < boxes_b[:, 2]) &
+            (boxes_b[:, 0] < boxes_a[:, 2]) &
+            (boxes_a[:, 1] < boxes_b[:, 3]) &
+            (boxes_b[:, 1] < boxes_a[:, 3])
         )
 
     """
@@ -240,18 +377,21 @@ class BoundingBox:
         Returns:
             New scaled BoundingBox instance.
         """
-        center = self.center
-        center_x = center.x
-        center_y = center.y
-        new_half_width = (self.width * factor) / 2
-        new_half_height = (self.height * factor) / 2
-
-        return BoundingBox(
-            x1=max(0, center_x - new_half_width),
-            y1=max(0, center_y - new_half_height),
-            x2=center_x + new_half_width,
-            y2=center_y + new_half_height
-        )
+        center_x = (self.x1 + self.x2) / 2
+        center_y = (self.y1 + self.y2) / 2
+        half_factor = factor * 0.5
+        new_half_width = (self.x2 - self.x1) * half_factor
+        new_half_height = (self.y2 - self.y1) * half_factor
+        x1 = max(0, center_x - new_half_width)
+        y1 = max(0, center_y - new_half_height)
+        x2 = center_x + new_half_width
+        y2 = center_y + new_half_height
+
+        # x1, y1 are clamped to the origin, ordered corners make the box valid.
+        # Others are rejected explicitly, __post_init__ skips it under python -O
+        if not (x1 < x2 and y1 < y2):
+            BoundingBox._validate(x1, y1, x2, y2)
+        return BoundingBox._unchecked(x1, y1, x2, y2)
 
     """
     Distance methods
@@ -263,10 +403,10 @@ class BoundingBox:
         Returns:
             Euclidean distance between the centers.
         """
-        c1 = self.center
-        c2 = other.center
-
-        return float(((c2.x - c1.x) ** 2 + (c2.y - c1.y) ** 2) ** 0.5)
+        return center_distance(
+            self.x1, self.y1, self.x2, self.y2,
+            other.x1, other.y1, other.x2, other.y2
+        )
 
     def edge_distance(self, other: Self) -> float:
         """Calculate the minimum distance between the edges of two boxes.
@@ -275,10 +415,7 @@ class BoundingBox:
         Returns:
             Minimum distance between the edges. 0 if they overlap.
         """
-        if self.overlaps(other):
-            return 0.0
-
-        dx = max(other.x1 - self.x2, self.x1 - other.x2, 0)
-        dy = max(other.y1 - self.y2, self.y1 - other.y2, 0)
-
-        return float((dx ** 2 + dy ** 2) ** 0.5)
+        return edge_distance(
+            self.x1, self.y1, self.x2, self.y2,
+            other.x1, other.y1, other.x2, other.y2
+        )
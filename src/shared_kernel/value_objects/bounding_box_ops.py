@@ -0,0 +1,205 @@
+"""
+Compiled geometry kernels for BoundingBox.
+
+Kernels take plain floats / arrays so they can be JIT-compiled with Numba.
+Scalar kernels release the GIL (`nogil`), so geometry queries from
+worker threads do not serialize on it. Numba is optional (`jit` extra) -
+without it the same functions run as regular Python and `iou_matrix`
+falls back to NumPy broadcasting.
+
+BoundingBox calls the scalar kernels through the `iou`, `edge_distance`
+and `center_distance` entry points. When the `_geom_aot`
+extension is built (see `build_kernels`) they point to its precompiled
+functions, so the first call does not pay the JIT compile.
+"""
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING, Any, Generic, ParamSpec, Protocol, TypeVar, cast
+
+import numpy as np
+
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    class _Kernel(Protocol, Generic[_P, _R]):
+        """Compiled kernel: callable like the function, keeps it in `py_func`."""
+        py_func: Callable[_P, _R]
+
+        def __call__(self, *args: _P.args, **kwargs: _P.kwargs) -> _R: ...
+
+    def njit(**kwargs: Any) -> Callable[[Callable[_P, _R]], _Kernel[_P, _R]]: ...
+
+    prange = range
+    NUMBA_AVAILABLE: bool
+else:
+    try:
+        from numba import njit, prange
+
+        NUMBA_AVAILABLE = True
+    except ImportError:
+        NUMBA_AVAILABLE = False
+        prange = range
+
+        def njit(*args, **kwargs):  # noqa: ARG001
+            """No-op stand-in for numba.njit, keeps `py_func` like a dispatcher."""
+            def decorator(fn):
+                fn.py_func = fn
+                return fn
+
+            if args and callable(args[0]):
+                return decorator(args[0])
+            return decorator
+
+
+@njit(cache=True, nogil=True, fastmath=True)
+def point_distance_scalar(ax: float, ay: float, bx: float, by: float) -> float:
+    """Euclidean distance between points a and b (hypot, no overflow on large values).
+    Building block for the other kernels, `Point.distance_to` calls
+    `math.hypot` directly (cheaper than a dispatcher call from Python).
+    """
+    return math.hypot(bx - ax, by - ay)
+
+
+@njit(cache=True, nogil=True, fastmath=True)
+def iou_scalar(
+    ax1: float, ay1: float, ax2: float, ay2: float,
+    bx1: float, by1: float, bx2: float, by2: float
+) -> float:
+    """IoU of boxes a and b given as x1, y1, x2, y2.
+
+    Intersection area is computed inline from the overlap extents, no
+    intermediate box is built. Disjoint boxes return before the union
+    arithmetic, x first: in wide traffic frames boxes are mostly separated
+    horizontally. Zero-area union gives 0.0.
+    """
+    inter_w = min(ax2, bx2) - max(ax1, bx1)
+    if inter_w <= 0.0:
+        return 0.0
+    inter_h = min(ay2, by2) - max(ay1, by1)
+    if inter_h <= 0.0:
+        return 0.0
+
+    intersection_area = inter_w * inter_h
+    area_a = (ax2 - ax1) * (ay2 - ay1)
+    area_b = (bx2 - bx1) * (by2 - by1)
+    union_area = area_a + area_b - intersection_area
+
+    if union_area <= 0.0:
+        return 0.0
+    return intersection_area / union_area
+
+
+@njit(cache=True, nogil=True, fastmath=True)
+def edge_distance_scalar(
+    ax1: float, ay1: float, ax2: float, ay2: float,
+    bx1: float, by1: float, bx2: float, by2: float
+) -> float:
+    """Minimum distance between edges of boxes a and b, 0 if they overlap."""
+    dx = max(bx1 - ax2, ax1 - bx2, 0.0)
+    dy = max(by1 - ay2, ay1 - by2, 0.0)
+
+    return point_distance_scalar(0.0, 0.0, dx, dy)
+
+
+@njit(cache=True, nogil=True, fastmath=True)
+def center_distance_scalar(
+    ax1: float, ay1: float, ax2: float, ay2: float,
+    bx1: float, by1: float, bx2: float, by2: float
+) -> float:
+    """Euclidean distance between centers of boxes a and b."""
+    return point_distance_scalar(
+        (ax1 + ax2) / 2, (ay1 + ay2) / 2, (bx1 + bx2) / 2, (by1 + by2) / 2
+    )
+
+
+# Entry points for value objects: ahead-of-time compiled when available
+try:
+    from . import _geom_aot  # type: ignore[attr-defined]
+
+    AOT_AVAILABLE = True
+    iou: Callable[..., float] = _geom_aot.iou
+    edge_distance: Callable[..., float] = _geom_aot.edge_distance
+    center_distance: Callable[..., float] = _geom_aot.center_distance
+except ImportError:
+    AOT_AVAILABLE = False
+    iou = iou_scalar
+    edge_distance = edge_distance_scalar
+    center_distance = center_distance_scalar
+
+
+@njit(cache=True, parallel=True, boundscheck=False)
+def _iou_matrix_kernel(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    n = a.shape[0]
+    m = b.shape[0]
+    out = np.zeros((n, m), dtype=np.float32)
+    for i in prange(n):
+        for j in range(m):
+            out[i, j] = iou_scalar(
+                a[i, 0], a[i, 1], a[i, 2], a[i, 3],
+                b[j, 0], b[j, 1], b[j, 2], b[j, 3]
+            )
+    return out
+
+
+def iou_matrix(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Pairwise Intersection over Union of (N, 4) and (M, 4) boxes.
+
+    Uses the parallel Numba kernel when available, NumPy broadcasting otherwise.
+
+    Args:
+        a: (N, 4) array of x1, y1, x2, y2.
+        b: (M, 4) array of x1, y1, x2, y2.
+    Returns:
+        (N, M) float32 array, entry [i, j] is IoU of a[i] and b[j].
+    """
+    if NUMBA_AVAILABLE:
+        return _iou_matrix_kernel(
+            np.ascontiguousarray(a, dtype=np.float32),
+            np.ascontiguousarray(b, dtype=np.float32)
+        )
+
+    a = np.asarray(a, dtype=np.float32)
+    b = np.asarray(b, dtype=np.float32)
+
+    inter_w = np.minimum(a[:, None, 2], b[None, :, 2])
+    inter_w -= np.maximum(a[:, None, 0], b[None, :, 0])
+    inter_h = np.minimum(a[:, None, 3], b[None, :, 3])
+    inter_h -= np.maximum(a[:, None, 1], b[None, :, 1])
+    inter = np.clip(inter_w, 0, None) * np.clip(inter_h, 0, None)
+
+    area_a = (a[:, 2] - a[:, 0]) * (a[:, 3] - a[:, 1])
+    area_b = (b[:, 2] - b[:, 0]) * (b[:, 3] - b[:, 1])
+    union = area_a[:, None] + area_b[None, :] - inter
+    return cast(
+        "np.ndarray",
+        np.divide(inter, union, out=np.zeros_like(inter), where=union > 0),
+    )
+
+
+def iou_pairwise(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Row-wise Intersection over Union of two (N, 4) box arrays.
+
+    Args:
+        a: (N, 4) array of x1, y1, x2, y2.
+        b: (N, 4) array of x1, y1, x2, y2.
+    Returns:
+        (N,) float32 array, entry [i] is IoU of a[i] and b[i].
+    """
+    a = np.asarray(a, dtype=np.float32)
+    b = np.asarray(b, dtype=np.float32)
+
+    inter_w = np.minimum(a[:, 2], b[:, 2]) - np.maximum(a[:, 0], b[:, 0])
+    inter_h = np.minimum(a[:, 3], b[:, 3]) - np.maximum(a[:, 1], b[:, 1])
+    inter = np.clip(inter_w, 0, None) * np.clip(inter_h, 0, None)
+
+    area_a = (a[:, 2] - a[:, 0]) * (a[:, 3] - a[:, 1])
+    area_b = (b[:, 2] - b[:, 0]) * (b[:, 3] - b[:, 1])
+    union = area_a + area_b - inter
+    return cast(
+        "np.ndarray",
+        np.divide(inter, union, out=np.zeros_like(inter), where=union > 0),
+    )
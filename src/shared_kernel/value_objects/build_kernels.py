@@ -0,0 +1,41 @@
+"""
+Ahead-of-time build of the scalar geometry kernels.
+
+Compiles the kernels of `bounding_box_ops` into the `_geom_aot` extension
+module next to this file, so BoundingBox methods skip the JIT
+compile on first call. Requires Numba (`jit` extra) and a C compiler:
+
+    python -m shared_kernel.value_objects.build_kernels
+
+Without the extension the same kernels are JIT-compiled at runtime.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+
+from numba.pycc import CC
+
+from shared_kernel.value_objects.bounding_box_ops import (
+    center_distance_scalar,
+    edge_distance_scalar,
+    iou_scalar,
+)
+
+AOT_MODULE = "_geom_aot"
+
+_BOX_PAIR_SIG = "f8(f8, f8, f8, f8, f8, f8, f8, f8)"
+
+
+def build() -> None:
+    cc = CC(AOT_MODULE)
+    cc.output_dir = str(Path(__file__).parent)
+
+    cc.export("iou", _BOX_PAIR_SIG)(iou_scalar.py_func)
+    cc.export("edge_distance", _BOX_PAIR_SIG)(edge_distance_scalar.py_func)
+    cc.export("center_distance", _BOX_PAIR_SIG)(center_distance_scalar.py_func)
+
+    cc.compile()
+
+
+if __name__ == "__main__":
+    build()
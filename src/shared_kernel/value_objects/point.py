@@ -1,13 +1,14 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from math import sqrt
+import math
+from typing import NamedTuple
 
 
-@dataclass(frozen=True, slots=True)
-class Point:
+class Point(NamedTuple):
     """
     Immutable point in 2D space.
+    NamedTuple: cheap construction, C-level field access and `x, y = point`
+    unpacking. Compares equal to a plain (x, y) tuple.
     """
     x: float
     y: float
@@ -19,7 +20,19 @@ class Point:
         Returns:
             Euclidean distance as a float.
         """
-        return sqrt((self.x - other.x)**2 + (self.y - other.y)**2)
+        return math.hypot(self.x - other.x, self.y - other.y)
+
+    def distance_squared_to(self, other: Point) -> float:
+        """Calculate the squared Euclidean distance to another point.
+        Skips the square root, use it for comparing distances (ex. nearest point).
+        Args:
+            other (Point): Another point.
+        Returns:
+            Squared Euclidean distance as a float.
+        """
+        dx = self.x - other.x
+        dy = self.y - other.y
+        return dx * dx + dy * dy
 
     def as_tuple(self) -> tuple[float, float]:
         """Return the point as a tuple (x, y).
@@ -1,16 +1,17 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from math import atan2, sqrt
+from math import atan2, hypot
+from typing import NamedTuple
 
 
-@dataclass(frozen=True, slots=True)
-class Velocity:
+class Velocity(NamedTuple):
     """
     Immutable velocity vector in 2D space.
+    NamedTuple like Point: cheap construction and `dx, dy = velocity`
+    unpacking. Compares equal to a plain (dx, dy) tuple.
     Attributes:
-        vx (float): Velocity component in x-direction.
-        vy (float): Velocity component in y-direction.
+        dx (float): Velocity component in x-direction.
+        dy (float): Velocity component in y-direction.
     """
     dx: float
     dy: float
@@ -21,7 +22,7 @@ class Velocity:
         Returns:
             Speed as a float.
         """
-        return sqrt(self.dx**2 + self.dy**2)
+        return hypot(self.dx, self.dy)
 
     @property
     def angle(self) -> float:
@@ -0,0 +1,38 @@
+"""
+Shared fixtures.
+
+Compiled geometry kernels are tested twice: through the Numba dispatcher
+(marked `numba`) and through `py_func`, the plain Python source. Coverage
+runs can set NUMBA_DISABLE_JIT=1 and deselect `-m "not numba"`, a separate
+job runs `-m numba` against the compiled code.
+"""
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from shared_kernel.value_objects.bounding_box_ops import iou_scalar
+
+
+@pytest.fixture(params=[
+    pytest.param(True, id="jit", marks=pytest.mark.numba),
+    pytest.param(False, id="py_func"),
+])
+def compiled(request: pytest.FixtureRequest) -> bool:
+    """Whether kernel tests run the compiled dispatcher or its Python function."""
+    return bool(request.param)
+
+
+@pytest.fixture
+def kernel_impl(compiled: bool) -> Callable[[Any], Any]:
+    """Resolve a kernel to the implementation selected by `compiled`."""
+    def resolve(kernel: Any) -> Any:
+        # Without Numba, or with NUMBA_DISABLE_JIT, kernels may be plain functions
+        return kernel if compiled else getattr(kernel, "py_func", kernel)
+    return resolve
+
+
+@pytest.fixture
+def iou_impl(kernel_impl: Callable[[Any], Any]) -> Any:
+    """Scalar IoU kernel, compiled or plain Python."""
+    return kernel_impl(iou_scalar)
@@ -0,0 +1,110 @@
+"""
+Tests for DetectionBatch (structure of arrays detections).
+"""
+from math import isclose
+
+import numpy as np
+import pytest
+
+from shared_kernel.detection_core.domain.detection_batch import (
+    DetectionBatch,
+    iou_matrix,
+)
+from shared_kernel.semantic_model.labels import SemanticClass
+
+
+@pytest.fixture
+def batch() -> DetectionBatch:
+    return DetectionBatch(
+        coords=np.array(
+            [[0.0, 0.0, 10.0, 10.0], [5.0, 5.0, 15.0, 15.0], [20.0, 20.0, 30.0, 40.0]],
+            dtype=np.float32
+        ),
+        cls=np.array([0, 5, 6], dtype=np.int8),
+        conf=np.array([0.9, 0.5, 0.25], dtype=np.float32)
+    )
+
+
+class TestDetectionBatchCreation:
+    """Tests for DetectionBatch construction."""
+
+    def test_empty(self):
+        """Empty batch has no detections."""
+        empty = DetectionBatch.empty()
+        assert len(empty) == 0
+        assert list(empty) == []
+
+    def test_inconsistent_shapes_raise(self):
+        """Columns of different length should be rejected."""
+        with pytest.raises(ValueError, match="Inconsistent batch shapes"):
+            DetectionBatch(
+                coords=np.zeros((2, 4), dtype=np.float32),
+                cls=np.zeros(3, dtype=np.int8),
+                conf=np.zeros(2, dtype=np.float32)
+            )
+
+    def test_from_detections_roundtrip(self, batch):
+        """Packing Detection views back should give the same columns."""
+        repacked = DetectionBatch.from_detections(list(batch))
+        np.testing.assert_array_equal(repacked.coords, batch.coords)
+        np.testing.assert_array_equal(repacked.cls, batch.cls)
+        np.testing.assert_array_equal(repacked.conf, batch.conf)
+
+
+class TestDetectionBatchSequence:
+    """Tests for the Detection view of the batch."""
+
+    def test_len(self, batch):
+        assert len(batch) == 3
+
+    def test_getitem_returns_detection(self, batch):
+        """Indexing builds a Detection with matching fields."""
+        det = batch[2]
+        assert det.bbox.to_tuple() == (20.0, 20.0, 30.0, 40.0)
+        assert det.class_label.value == SemanticClass.UNKNOWN.value
+        assert isclose(det.confidence, 0.25)
+        assert det.track_id is None
+
+    def test_detections_compare_by_value(self, batch):
+        """Rows built on each access are equal, so `in` and `index` work."""
+        assert batch[1] == batch[1]
+        assert batch[1] in batch
+        assert batch.index(batch[1]) == 1
+
+    def test_getitem_slice_returns_batch(self, batch):
+        """Slicing keeps the columnar representation."""
+        sliced = batch[1:]
+        assert isinstance(sliced, DetectionBatch)
+        assert len(sliced) == 2
+        assert sliced[0].class_label.value == SemanticClass.PEDASTRIAN.value
+
+    def test_iteration(self, batch):
+        assert [det.class_label for det in batch] == batch.labels
+
+    def test_filter(self, batch):
+        """Boolean mask selects rows from every column."""
+        filtered = batch.filter(batch.conf > 0.3)
+        assert len(filtered) == 2
+        assert [label.value for label in filtered.labels] == [
+            SemanticClass.CAR.value, SemanticClass.PEDASTRIAN.value
+        ]
+
+
+class TestDetectionBatchGeometry:
+    """Tests for vectorized geometry."""
+
+    def test_areas(self, batch):
+        np.testing.assert_allclose(batch.areas, [100.0, 100.0, 200.0])
+
+    def test_iou_matrix_matches_scalar_iou(self, batch):
+        """Every entry should equal BoundingBox.iou of the pair."""
+        matrix = batch.iou_matrix(batch)
+        assert matrix.shape == (3, 3)
+        for i, det_a in enumerate(batch):
+            for j, det_b in enumerate(batch):
+                assert isclose(matrix[i, j], det_a.bbox.iou(det_b.bbox), rel_tol=1e-6)
+
+    def test_iou_matrix_empty(self, batch):
+        """Empty side should give an empty matrix."""
+        empty = np.empty((0, 4), dtype=np.float32)
+        assert iou_matrix(batch.coords, empty).shape == (3, 0)
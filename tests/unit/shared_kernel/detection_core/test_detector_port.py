@@ -0,0 +1,68 @@
+"""
+Tests for default batch methods of DetectorPort.
+"""
+from shared_kernel.detection_core.ports.detector_port import DetectorPort
+from shared_kernel.exceptions import DomainError
+from shared_kernel.result_monad import Err, Ok
+
+
+class StubDetector(DetectorPort):
+    """Returns the frame as its only "detection", fails on frames equal to "bad"."""
+
+    def __init__(self):
+        self.calls = []
+
+    def detect(self, frame, filter_classes=None):
+        self.calls.append((frame, filter_classes))
+        if frame == "bad":
+            return Err(DomainError(f"cannot detect on frame {len(self.calls)}"))
+        return Ok([frame])
+
+
+class TestDetectBatch:
+    """Tests for the per-frame detect_batch fallback."""
+
+    def test_results_in_frame_order(self):
+        detector = StubDetector()
+        result = detector.detect_batch(["a", "b", "c"])
+
+        assert result.is_ok()
+        assert result.unwrap() == [["a"], ["b"], ["c"]]
+
+    def test_empty_batch(self):
+        assert StubDetector().detect_batch([]).unwrap() == []
+
+    def test_passes_filter_to_every_frame(self):
+        detector = StubDetector()
+        detector.detect_batch(["a", "b"], filter_classes={"car"})
+
+        assert [classes for _, classes in detector.calls] == [{"car"}, {"car"}]
+
+    def test_stops_at_first_error(self):
+        """Frames after the failing one are not processed."""
+        detector = StubDetector()
+        result = detector.detect_batch(["a", "bad", "c", "bad"])
+
+        assert result.is_err()
+        assert str(result.unwrap_err()) == "cannot detect on frame 2"
+        assert [frame for frame, _ in detector.calls] == ["a", "bad"]
+
+
+class TestSubmitBatch:
+    """Tests for the synchronous submit_batch fallback."""
+
+    def test_returns_completed_future(self):
+        """Detection runs before submit_batch returns."""
+        detector = StubDetector()
+        future = detector.submit_batch(["a", "b"])
+
+        assert future.done()
+        assert len(detector.calls) == 2
+        assert future.result().unwrap() == [["a"], ["b"]]
+
+    def test_future_holds_error_result(self):
+        """Detection errors are returned as Err, not raised from the future."""
+        future = StubDetector().submit_batch(["bad"])
+
+        assert future.exception() is None
+        assert future.result().is_err()
@@ -1,7 +1,8 @@
 from unittest.mock import Mock
 
 import pytest
-from src.shared_kernel import Err, Ok, Result
+
+from shared_kernel import Err, Ok, Result
 
 
 class TestOkState:
@@ -12,6 +13,7 @@ class TestOkState:
         assert res.is_ok() is True
         assert res.is_err() is False
         assert repr(res) == "Ok(10)"
+        assert res.ok is True
 
     def test_unwrap_methods(self):
         """Method unwraping values."""
@@ -47,6 +49,25 @@ class TestOkState:
         Ok("data").inspect_err(spy)
         spy.assert_not_called()
 
+    def test_repr_follows_mutable_payload(self):
+        """repr is built on every call, mutated payloads are shown as they are."""
+        res: Result[list[int], str] = Ok([])
+        assert repr(res) == "Ok([])"
+        res.unwrap().append(1)
+        assert repr(res) == "Ok([1])"
+
+    def test_ok_none_is_shared(self):
+        """ok_none returns the same Ok(None) instance on every call."""
+        assert Result.ok_none() is Result.ok_none()
+        assert Result.ok_none() == Ok(None)
+
+    def test_ok_bool_is_shared(self):
+        """ok_bool returns one shared instance per boolean."""
+        assert Result.ok_bool(True) is Result.ok_bool(True)
+        assert Result.ok_bool(False) is Result.ok_bool(False)
+        assert Result.ok_bool(True) == Ok(True)
+        assert Result.ok_bool(False) == Ok(False)
+
 class TestErrState:
     """Tests veryfing monad behaviour in error state."""
 
@@ -54,6 +75,7 @@ class TestErrState:
         res: Result[int, str] = Err("Error")
         assert res.is_ok() is False
         assert res.is_err() is True
+        assert res.ok is False
         assert repr(res) == "Err(Error)"
 
     def test_unwrap_raises_error(self):
@@ -156,3 +178,23 @@ class TestMonadicChaining:
             .map(lambda x: x + 1)     # -> Ignored
         )
         assert chain_fail == Err("Negative")
+
+    def test_pipe_equivalent_to_flat_map_chain(self):
+        """pipe(f, g, h) gives the same result as
+        .flat_map(f).flat_map(g).flat_map(h)."""
+        def half(x: int) -> Result[int, str]:
+            return Ok(x // 2) if x % 2 == 0 else Err(f"Odd: {x}")
+
+        def positive(x: int) -> Result[int, str]:
+            return Ok(x) if x > 0 else Err("Negative")
+
+        for start in (Ok(8), Ok(6), Ok(-4), Err("Start")):
+            chained = start.flat_map(half).flat_map(positive).flat_map(half)
+            assert start.pipe(half, positive, half) == chained
+
+    def test_pipe_stops_at_first_err(self):
+        """Functions after the first Err are not called."""
+        spy = Mock()
+        res = Ok(1).pipe(lambda _: Err("Stop"), spy)
+        spy.assert_not_called()
+        assert res == Err("Stop")
@@ -1,10 +1,18 @@
 """
 Tests for BoundingBox value object.
 """
+from dataclasses import astuple
 from math import isclose
 
+import numpy as np
 import pytest
-from src.shared_kernel.value_objects import BoundingBox, InvalidBoundingBoxError, Point
+
+from shared_kernel.value_objects import (
+    BBoxErr,
+    BoundingBox,
+    InvalidBoundingBoxError,
+    Point,
+)
 
 
 class TestBoundingBoxCreation:
@@ -63,6 +71,35 @@ class TestBoundingBoxCreation:
         assert result.is_err()
         assert "y1 (25.0) must be less than y2 (25.0)" in result.unwrap_err()
 
+    @pytest.mark.parametrize(("coords", "code", "pattern"), [
+        (
+            (30.0, 20.0, 10.0, 40.0), BBoxErr.INVERTED_X,
+            r"x1 \(30\.0\) must be less than x2 \(10\.0\)"
+        ),
+        (
+            (10.0, 40.0, 30.0, 20.0), BBoxErr.INVERTED_Y,
+            r"y1 \(40\.0\) must be less than y2 \(20\.0\)"
+        ),
+        (
+            (-5.0, 20.0, 30.0, 40.0), BBoxErr.NEGATIVE_X,
+            r"x1 \(-5\.0\) must be non-negative"
+        ),
+        (
+            (10.0, -10.0, 30.0, 40.0), BBoxErr.NEGATIVE_Y,
+            r"y1 \(-10\.0\) must be non-negative"
+        ),
+    ])
+    def test_constructor_raises_with_code(self, coords, code, pattern):
+        """Constructor raises error carrying the violation code,
+        message built on str()."""
+        with pytest.raises(InvalidBoundingBoxError, match=pattern) as exc_info:
+            BoundingBox(*coords)
+        assert exc_info.value.code == code
+
+    def test_error_with_plain_message(self):
+        """A message passed instead of a code is used as is."""
+        assert str(InvalidBoundingBoxError("custom message")) == "custom message"
+
 class TestBoundingBoxFactoryMethods:
     """Tests for BoundingBox factory methods."""
 
@@ -75,6 +112,25 @@ class TestBoundingBoxFactoryMethods:
         assert bbox.x2 == 15.0
         assert bbox.y2 == 20.0
 
+    def test_try_create_fast_valid(self):
+        """Valid coordinates should give the same box as the constructor."""
+        bbox, err = BoundingBox.try_create_fast(10.0, 20.0, 30.0, 40.0)
+        assert bbox == BoundingBox(x1=10.0, y1=20.0, x2=30.0, y2=40.0)
+        assert err == BBoxErr.OK
+
+    @pytest.mark.parametrize(("coords", "expected"), [
+        ((30.0, 20.0, 10.0, 40.0), BBoxErr.INVERTED_X),
+        ((10.0, 40.0, 30.0, 20.0), BBoxErr.INVERTED_Y),
+        ((-5.0, 20.0, 30.0, 40.0), BBoxErr.NEGATIVE_X),
+        ((10.0, -10.0, 30.0, 40.0), BBoxErr.NEGATIVE_Y),
+        ((15.0, 20.0, 15.0, 40.0), BBoxErr.INVERTED_X),
+    ])
+    def test_try_create_fast_invalid_returns_code(self, coords, expected):
+        """Rejected coordinates should give None and the violation code."""
+        bbox, err = BoundingBox.try_create_fast(*coords)
+        assert bbox is None
+        assert err == expected
+
 class TestBoundingBoxProperties:
     """Tests for BoundingBox properties."""
 
@@ -93,9 +149,86 @@ class TestBoundingBoxProperties:
         bbox = BoundingBox(x1=10.0, y1=20.0, x2=30.0, y2=40.0)
         assert isclose(bbox.area, 400.0)
 
+# (box a, box b, expected IoU) shared by the scalar and vectorized IoU paths
+IOU_CASES = [
+    ((10.0, 10.0, 20.0, 20.0), (10.0, 10.0, 20.0, 20.0), 1.0),
+    ((0.0, 0.0, 10.0, 10.0), (15.0, 15.0, 25.0, 25.0), 0.0),
+    ((0.0, 0.0, 10.0, 10.0), (10.0, 10.0, 20.0, 20.0), 0.0),
+    ((5.0, 5.0, 15.0, 15.0), (8.0, 8.0, 18.0, 18.0), 49 / 151),
+    ((0.0, 0.0, 20.0, 20.0), (5.0, 5.0, 15.0, 15.0), 0.25),
+]
+
+
+def _iou_scalar(a, b):
+    return BoundingBox(*a).iou(BoundingBox(*b))
+
+
+def _iou_batch(a, b):
+    return float(BoundingBox.iou_batch(
+        np.array([a], dtype=np.float32), np.array([b], dtype=np.float32)
+    )[0])
+
+
 class TestBoundingBoxIoU:
     """Tests for Intersection over Union (IoU) calculation."""
 
+    @pytest.mark.parametrize("iou", [_iou_scalar, _iou_batch], ids=["scalar", "batch"])
+    @pytest.mark.parametrize(("box_a", "box_b", "expected"), IOU_CASES)
+    def test_iou_cases(self, iou, box_a, box_b, expected):
+        """Scalar and vectorized IoU should agree on the same boxes."""
+        assert isclose(iou(box_a, box_b), expected, rel_tol=1e-6)
+
+    @pytest.mark.parametrize("other", [
+        BoundingBox(x1=15.0, y1=0.0, x2=25.0, y2=10.0),
+        BoundingBox(x1=0.0, y1=15.0, x2=10.0, y2=25.0),
+        BoundingBox(x1=10.0, y1=0.0, x2=20.0, y2=10.0),
+        BoundingBox(x1=10.0, y1=10.0, x2=20.0, y2=20.0),
+    ], ids=["separated_x", "separated_y", "touching_edge", "touching_corner"])
+    def test_iou_disjoint_fast_path(self, other):
+        """Disjoint and touching boxes give exactly 0.0."""
+        bbox = BoundingBox(x1=0.0, y1=0.0, x2=10.0, y2=10.0)
+        assert bbox.iou(other) == 0.0
+        assert other.iou(bbox) == 0.0
+
+    @pytest.mark.parametrize(("box_a", "box_b", "expected"), IOU_CASES)
+    def test_iou_kernel_cases(self, iou_impl, box_a, box_b, expected):
+        """The scalar kernel behind iou(), compiled and as plain Python."""
+        assert isclose(iou_impl(*box_a, *box_b), expected, rel_tol=1e-6)
+
+    def test_iou_batch_all_rows(self):
+        """iou_batch computes every row pair in one call."""
+        boxes_a = np.array([case[0] for case in IOU_CASES], dtype=np.float32)
+        boxes_b = np.array([case[1] for case in IOU_CASES], dtype=np.float32)
+        np.testing.assert_allclose(
+            BoundingBox.iou_batch(boxes_a, boxes_b),
+            [case[2] for case in IOU_CASES],
+            rtol=1e-6
+        )
+
+    def test_iou_batch_downcasts_to_float32(self):
+        """FP64 input is computed in float32, within 1e-6 of the scalar FP64 IoU."""
+        boxes_a = np.array([case[0] for case in IOU_CASES], dtype=np.float64)
+        boxes_b = np.array([case[1] for case in IOU_CASES], dtype=np.float64)
+
+        result = BoundingBox.iou_batch(boxes_a, boxes_b)
+
+        assert result.dtype == np.float32
+        expected = [_iou_scalar(a, b) for a, b, _ in IOU_CASES]
+        np.testing.assert_allclose(result, expected, rtol=1e-6)
+
+    def test_iou_matrix_matches_scalar(self):
+        """Entry [i, j] of iou_matrix equals IoU of the i-th and j-th box."""
+        boxes_a = np.array([case[0] for case in IOU_CASES], dtype=np.float32)
+        boxes_b = np.array([case[1] for case in IOU_CASES[:3]], dtype=np.float32)
+
+        matrix = BoundingBox.iou_matrix(boxes_a, boxes_b)
+
+        assert matrix.shape == (5, 3)
+        assert matrix.dtype == np.float32
+        for i, box_a in enumerate(boxes_a.tolist()):
+            for j, box_b in enumerate(boxes_b.tolist()):
+                assert isclose(matrix[i, j], _iou_scalar(box_a, box_b), rel_tol=1e-6)
+
     def test_iou_identical_boxes(self):
         """Test IoU calculation for identical boxes."""
         bbox1 = BoundingBox(x1=10.0, y1=10.0, x2=20.0, y2=20.0)
@@ -174,6 +307,20 @@ class TestBoundingBoxContainment:
         assert bbox.contains_point(10.0, 20.0) is True
         assert bbox.contains_point(20.0, 10.0) is True
 
+    def test_contains_points_matches_contains_point(self):
+        """Vectorized check should agree with contains_point on a grid,
+        edges included."""
+        bbox = BoundingBox(x1=10.0, y1=10.0, x2=20.0, y2=20.0)
+        xs, ys = np.meshgrid(np.linspace(0.0, 30.0, 31), np.linspace(0.0, 30.0, 31))
+
+        inside = bbox.contains_points(xs, ys)
+
+        expected = [
+            bbox.contains_point(x, y)
+            for x, y in zip(xs.ravel(), ys.ravel(), strict=True)
+        ]
+        assert inside.ravel().tolist() == expected
+
     def test_contains_box_inner(self):
         """Smaller box inside should be contained."""
         outer = BoundingBox(x1=0.0, y1=0.0, x2=20.0, y2=20.0)
@@ -207,6 +354,19 @@ class TestBoundingBoxContainment:
         assert box1.overlaps(box2) is False
         assert box2.overlaps(box1) is False
 
+    def test_overlaps_batch_matches_scalar(self):
+        """Vectorized overlaps agrees with overlaps row by row, touching included."""
+        boxes_a = np.array([case[0] for case in IOU_CASES], dtype=np.float32)
+        boxes_b = np.array([case[1] for case in IOU_CASES], dtype=np.float32)
+
+        result = BoundingBox.overlaps_batch(boxes_a, boxes_b)
+
+        expected = [
+            BoundingBox(*a).overlaps(BoundingBox(*b)) for a, b, _ in IOU_CASES
+        ]
+        assert result.tolist() == expected
+        assert expected == [True, False, False, True, True]
+
 class TestBoundingBoxTransformation:
     """Tests for bounding box transformations methods."""
 
@@ -268,6 +428,13 @@ class TestBoundingBoxTransformation:
         assert scaled.center == expected_center
         assert bbox.center == expected_center
 
+    @pytest.mark.parametrize("factor", [0.0, -1.0])
+    def test_scale_non_positive_factor_raises(self, factor):
+        """Zero or negative factor collapses the box, which still fails validation."""
+        bbox = BoundingBox(x1=20.0, y1=30.0, x2=60.0, y2=70.0)
+        with pytest.raises(InvalidBoundingBoxError):
+            bbox.scale(factor=factor)
+
 class TestBoundingBoxDistance:
     """Tests for bounding box distance calculations."""
     def test_center_distance_same_center(self):
@@ -346,6 +513,16 @@ class TestBoundingBoxImmutability:
         with pytest.raises(AttributeError):
             bbox.y2 = 150.0 # type: ignore
 
+    def test_dataclass_fields_are_coordinates(self):
+        """Only the four coordinates are dataclass fields (astuple, asdict)."""
+        bbox = BoundingBox(x1=1.0, y1=2.0, x2=3.0, y2=4.0)
+        assert astuple(bbox) == (1.0, 2.0, 3.0, 4.0)
+
+    def test_slotted(self):
+        """BoundingBox should use slots, without a per-instance __dict__."""
+        bbox = BoundingBox(x1=10.0, y1=20.0, x2=100.0, y2=200.0)
+        assert not hasattr(bbox, "__dict__")
+
     def test_translate_returns_new(self) -> None:
         """Translate should return new object, not modify original."""
         original = BoundingBox(x1=0.0, y1=0.0, x2=10.0, y2=10.0)
@@ -402,6 +579,21 @@ class TestBoundingBoxConversions:
         bbox = BoundingBox(x1=1.0, y1=2.0, x2=3.0, y2=4.0)
         assert bbox.to_tuple() == (1.0, 2.0, 3.0, 4.0)
 
+    def test_stack(self):
+        """`stack` packs boxes into an (N, 4) float32 array in order."""
+        bboxes = [
+            BoundingBox(x1=1.0, y1=2.0, x2=3.0, y2=4.0),
+            BoundingBox(x1=5.0, y1=6.0, x2=7.0, y2=8.0),
+        ]
+        stacked = BoundingBox.stack(bboxes)
+        assert stacked.dtype == np.float32
+        assert stacked.flags.c_contiguous
+        np.testing.assert_array_equal(stacked, [[1, 2, 3, 4], [5, 6, 7, 8]])
+
+    def test_stack_empty(self):
+        """Stacking no boxes gives an empty (0, 4) array."""
+        assert BoundingBox.stack([]).shape == (0, 4)
+
     def test_intersection_overlap_returns_bbox(self):
         """`intersection` should return a BoundingBox for overlapping boxes."""
         b1 = BoundingBox(x1=0.0, y1=0.0, x2=10.0, y2=10.0)
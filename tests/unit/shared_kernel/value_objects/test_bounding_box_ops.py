@@ -0,0 +1,78 @@
+"""
+Tests for compiled geometry kernels.
+
+Every kernel is run both compiled and through `py_func` (plain Python),
+see the `kernel_impl` fixture in conftest.
+"""
+from math import isclose
+
+import pytest
+
+from shared_kernel.value_objects.bounding_box_ops import (
+    AOT_AVAILABLE,
+    center_distance,
+    center_distance_scalar,
+    edge_distance,
+    edge_distance_scalar,
+    iou,
+    iou_scalar,
+    point_distance_scalar,
+)
+
+
+class TestGeometryKernels:
+    """Tests for scalar kernels behind BoundingBox and Point methods."""
+
+    def test_point_distance(self, kernel_impl):
+        """3-4-5 triangle."""
+        assert isclose(kernel_impl(point_distance_scalar)(0.0, 0.0, 3.0, 4.0), 5.0)
+
+    def test_iou_partial_overlap(self, kernel_impl):
+        """Intersection 7x7 = 49, union 100 + 100 - 49 = 151."""
+        kernel = kernel_impl(iou_scalar)
+        assert isclose(
+            kernel(5.0, 5.0, 15.0, 15.0, 8.0, 8.0, 18.0, 18.0), 49 / 151, rel_tol=1e-6
+        )
+
+    def test_iou_no_overlap(self, kernel_impl):
+        kernel = kernel_impl(iou_scalar)
+        assert kernel(0.0, 0.0, 10.0, 10.0, 15.0, 15.0, 25.0, 25.0) == 0.0
+
+    def test_iou_zero_area_boxes(self, kernel_impl):
+        """Degenerate boxes have empty union, IoU is 0 instead of division by zero."""
+        kernel = kernel_impl(iou_scalar)
+        assert kernel(5.0, 5.0, 5.0, 5.0, 5.0, 5.0, 5.0, 5.0) == 0.0
+
+    def test_edge_distance_diagonal(self, kernel_impl):
+        """Gaps of 3 and 4 give edge distance 5."""
+        kernel = kernel_impl(edge_distance_scalar)
+        assert isclose(kernel(0.0, 0.0, 10.0, 10.0, 13.0, 14.0, 20.0, 20.0), 5.0)
+
+    def test_edge_distance_overlapping(self, kernel_impl):
+        kernel = kernel_impl(edge_distance_scalar)
+        assert kernel(0.0, 0.0, 10.0, 10.0, 5.0, 5.0, 15.0, 15.0) == 0.0
+
+    def test_center_distance(self, kernel_impl):
+        """Centers (5, 5) and (8, 9) are 5 apart."""
+        kernel = kernel_impl(center_distance_scalar)
+        assert isclose(kernel(0.0, 0.0, 10.0, 10.0, 3.0, 4.0, 13.0, 14.0), 5.0)
+
+
+@pytest.mark.skipif(not AOT_AVAILABLE, reason="_geom_aot extension not built")
+class TestAheadOfTimeKernels:
+    """Tests for the precompiled kernels of build_kernels."""
+
+    def test_aot_module_loaded(self):
+        """Entry points should come from the extension, not the JIT."""
+        assert iou.__module__.endswith("_geom_aot")
+
+    def test_aot_matches_jit(self):
+        """Precompiled kernels give the same results as the JIT ones."""
+        box_pair = (5.0, 5.0, 15.0, 15.0, 8.0, 12.0, 18.0, 30.0)
+        assert iou(*box_pair) == pytest.approx(iou_scalar(*box_pair))
+        assert edge_distance(*box_pair) == pytest.approx(
+            edge_distance_scalar(*box_pair)
+        )
+        assert center_distance(*box_pair) == pytest.approx(
+            center_distance_scalar(*box_pair)
+        )
@@ -5,7 +5,8 @@ from dataclasses import FrozenInstanceError
 from math import isclose
 
 import pytest
-from src.shared_kernel.value_objects import Point
+
+from shared_kernel.value_objects import Point
 
 
 class TestPoint:
@@ -39,9 +40,19 @@ class TestPoint:
         """Point attributes should be immutable."""
         p = Point(x=1.0, y=2.0)
 
-        with pytest.raises(FrozenInstanceError):
+        with pytest.raises((AttributeError, FrozenInstanceError)):
             p.x = 3.0 # type: ignore
 
+    def test_is_slotted(self):
+        """Point should use slots, without a per-instance __dict__."""
+        assert not hasattr(Point(x=1.0, y=2.0), "__dict__")
+
+    def test_unpacking(self):
+        """Point unpacks into its coordinates."""
+        x, y = Point(x=1.0, y=2.0)
+
+        assert (x, y) == (1.0, 2.0)
+
     # Geometric method tests
     def test_distance_to_zero(self):
         """Distance from a point to itself should be zero."""
@@ -68,6 +79,20 @@ class TestPoint:
 
         assert dist1 == dist2
 
+    def test_distance_squared_to(self):
+        """Squared distance skips the square root."""
+        p1 = Point(x=0.0, y=0.0)
+        p2 = Point(x=3.0, y=4.0)
+
+        assert p1.distance_squared_to(p2) == 25.0
+
+    def test_distance_to_uses_hypot_for_large_values(self):
+        """Squaring 1e200 would overflow, hypot keeps the result finite."""
+        p1 = Point(x=0.0, y=0.0)
+        p2 = Point(x=3e200, y=4e200)
+
+        assert isclose(p1.distance_to(p2), 5e200)
+
     # Conversion method tests
     def test_as_tuple(self):
         """Test conversion of Point to tuple."""
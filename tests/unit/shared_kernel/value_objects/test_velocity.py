@@ -5,7 +5,8 @@ from dataclasses import FrozenInstanceError
 from math import isclose, pi
 
 import pytest
-from src.shared_kernel.value_objects import Velocity
+
+from shared_kernel.value_objects import Velocity
 
 
 class TestVelocity:
@@ -34,13 +35,27 @@ class TestVelocity:
         assert len(unique_velocities) == 1
         assert v1 in unique_velocities
 
+    def test_fields_are_components(self):
+        """Speed and angle are computed, not fields."""
+        assert Velocity(dx=1.0, dy=2.0)._asdict() == {"dx": 1.0, "dy": 2.0}
+
     def test_is_immutable(self):
         """Velocity attributes should be immutable."""
         v = Velocity(dx=1.0, dy=2.0)
 
-        with pytest.raises(FrozenInstanceError):
+        with pytest.raises((AttributeError, FrozenInstanceError)):
             v.dx = 3.0 # type: ignore
 
+    def test_is_slotted(self):
+        """Velocity should use slots, without a per-instance __dict__."""
+        assert not hasattr(Velocity(dx=1.0, dy=2.0), "__dict__")
+
+    def test_unpacking(self):
+        """Velocity unpacks into its components."""
+        dx, dy = Velocity(dx=1.0, dy=2.0)
+
+        assert (dx, dy) == (1.0, 2.0)
+
     # Calculation tests
     def test_speed_calculation(self):
         """Test speed (magnitude) calculation of the velocity vector."""